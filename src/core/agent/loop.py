@@ -106,6 +106,7 @@ class AgentLoop:
         self._consolidating: set[str] = set()  # Session keys with consolidation in progress
         self._consolidation_tasks: set[asyncio.Task] = set()  # Strong refs to in-flight tasks
         self._consolidation_locks: dict[str, asyncio.Lock] = {}
+        self._http_clients: list[Any] = []  # Shared API clients to close on shutdown
         self._register_default_tools()
 
     def _register_default_tools(self) -> None:
@@ -138,6 +139,7 @@ class AgentLoop:
                     _JiraClient,
                 )
                 jira_client = _JiraClient(jira_cfg.base_url, jira_cfg.email, jira_cfg.api_token)
+                self._http_clients.append(jira_client)
                 self.tools.register(JiraCreateIssueTool(jira_client, jira_cfg.default_project))
                 self.tools.register(JiraListIssuesTool(jira_client, jira_cfg.default_project))
                 self.tools.register(JiraGetIssueTool(jira_client))
@@ -157,6 +159,7 @@ class AgentLoop:
                     _NotionClient,
                 )
                 notion_client = _NotionClient(notion_cfg.api_key)
+                self._http_clients.append(notion_client)
                 root = notion_cfg.root_page_id
                 self.tools.register(NotionCreatePageTool(notion_client, root))
                 self.tools.register(NotionGetPageTool(notion_client))
@@ -346,9 +349,20 @@ class AgentLoop:
                         chat_id=msg.chat_id,
                         content=f"Sorry, I encountered an error: {str(e)}"
                     ))
+                msg._release()
             except asyncio.TimeoutError:
                 continue
 
+        await self._close_http_clients()
+
+    async def _close_http_clients(self) -> None:
+        """Release the shared API client connection pools."""
+        for client in self._http_clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug("Error closing API client: {}", e)
+
     async def close_mcp(self) -> None:
         """Close MCP connections."""
         if self._mcp_stack:
@@ -536,6 +550,6 @@ class AgentLoop:
     ) -> str:
         """Process a message directly (for CLI or cron usage)."""
         await self._connect_mcp()
-        msg = InboundMessage(channel=channel, sender_id="user", chat_id=chat_id, content=content)
+        msg = InboundMessage(channel, "user", chat_id, content)
         response = await self._process_message(msg, session_key=session_key, on_progress=on_progress)
         return response.content if response else ""
@@ -4,12 +4,20 @@ import json
 import os
 import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 # Default builtin skills directory (relative to this file)
 BUILTIN_SKILLS_DIR = Path(__file__).parent.parent / "skills"
 
 
+@lru_cache(maxsize=None)
+def _has_bin(name: str) -> bool:
+    """Memoized shutil.which: requirement checks re-probe the same binaries
+    on every prompt build, and each probe stats every PATH entry."""
+    return shutil.which(name) is not None
+
+
 class SkillsLoader:
     """
     Loader for agent skills.
@@ -144,7 +152,7 @@ class SkillsLoader:
         missing = []
         requires = skill_meta.get("requires", {})
         for b in requires.get("bins", []):
-            if not shutil.which(b):
+            if not _has_bin(b):
                 missing.append(f"CLI: {b}")
         for env in requires.get("env", []):
             if not os.environ.get(env):
@@ -178,7 +186,7 @@ class SkillsLoader:
         """Check if skill requirements are met (bins, env vars)."""
         requires = skill_meta.get("requires", {})
         for b in requires.get("bins", []):
-            if not shutil.which(b):
+            if not _has_bin(b):
                 return False
         for env in requires.get("env", []):
             if not os.environ.get(env):
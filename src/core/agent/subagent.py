@@ -206,10 +206,10 @@ Summarize this naturally for the user. Keep it brief (1-2 sentences). Do not men
         
         # Inject as system message to trigger main agent
         msg = InboundMessage(
-            channel="system",
-            sender_id="subagent",
-            chat_id=f"{origin['channel']}:{origin['chat_id']}",
-            content=announce_content,
+            "system",
+            "subagent",
+            f"{origin['channel']}:{origin['chat_id']}",
+            announce_content,
         )
         
         await self.bus.publish_inbound(msg)
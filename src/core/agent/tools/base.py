@@ -7,11 +7,11 @@ from typing import Any
 class Tool(ABC):
     """
     Abstract base class for agent tools.
-    
+
     Tools are capabilities that the agent can use to interact with
     the environment, such as reading files, executing commands, etc.
     """
-    
+
     _TYPE_MAP = {
         "string": str,
         "integer": int,
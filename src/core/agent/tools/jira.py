@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from base64 import b64encode
-from typing import Any
+from typing import Any, AsyncIterator
 
 import httpx
 
@@ -17,6 +18,7 @@ class _JiraClient:
     def __init__(self, base_url: str, email: str, api_token: str):
         self.base_url = base_url.rstrip("/")
         self._auth = b64encode(f"{email}:{api_token}".encode()).decode()
+        self._client: httpx.AsyncClient | None = None
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -25,38 +27,61 @@ class _JiraClient:
             "Accept": "application/json",
         }
 
-    async def get(self, path: str, params: dict | None = None) -> dict:
-        async with httpx.AsyncClient() as client:
-            r = await client.get(
-                f"{self.base_url}{path}",
+    def _http(self) -> httpx.AsyncClient:
+        """Lazily create one persistent client shared by all Jira tools.
+
+        HTTP/2 multiplexes concurrent tool calls over a single TLS
+        connection instead of serializing them on HTTP/1.1 keep-alive.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
                 headers=self._headers(),
-                params=params,
+                http2=True,
                 timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20),
             )
-            r.raise_for_status()
-            return r.json()
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def get(self, path: str, params: dict | None = None) -> dict:
+        r = await self._http().get(path, params=params)
+        r.raise_for_status()
+        return r.json()
 
     async def post(self, path: str, body: dict) -> dict:
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                f"{self.base_url}{path}",
-                headers=self._headers(),
-                json=body,
-                timeout=30.0,
-            )
-            r.raise_for_status()
-            return r.json() if r.content else {}
+        r = await self._http().post(path, json=body)
+        r.raise_for_status()
+        return r.json() if r.content else {}
 
     async def put(self, path: str, body: dict) -> int:
-        async with httpx.AsyncClient() as client:
-            r = await client.put(
-                f"{self.base_url}{path}",
-                headers=self._headers(),
-                json=body,
-                timeout=30.0,
-            )
-            r.raise_for_status()
-            return r.status_code
+        r = await self._http().put(path, json=body)
+        r.raise_for_status()
+        return r.status_code
+
+    async def paginate(self, jql: str, page_size: int = 100) -> AsyncIterator[dict]:
+        """Yield all issues matching a JQL query across pages.
+
+        Uses the token-based POST search endpoint and prefetches the next
+        page while the caller consumes the current one, so parsing and
+        network transfer overlap.
+        """
+        body: dict[str, Any] = {"jql": jql, "maxResults": page_size}
+        data = await self.post("/rest/api/3/search/jql", body)
+        while True:
+            next_task = None
+            if token := data.get("nextPageToken"):
+                next_task = asyncio.create_task(
+                    self.post("/rest/api/3/search/jql", {**body, "nextPageToken": token})
+                )
+            for issue in data.get("issues", []):
+                yield issue
+            if next_task is None:
+                return
+            data = await next_task
 
 
 def _text_to_adf(text: str) -> dict:
@@ -145,7 +170,7 @@ class JiraCreateIssueTool(Tool):
             result = await self._client.post("/rest/api/3/issue", {"fields": fields})
             return json.dumps({"key": result.get("key"), "self": result.get("self")})
         except httpx.HTTPStatusError as e:
-            return f"Error {e.response.status_code}: {e.response.text[:500]}"
+            return f"Error {e.response.status_code}: {e.response.content[:500].decode('utf-8', errors='replace')}"
         except Exception as e:
             return f"Error: {e}"
 
@@ -162,6 +187,10 @@ class JiraListIssuesTool(Tool):
             "status": {"type": "string", "description": "Filter by status (e.g. 'To Do', 'In Progress', 'Done')"},
             "assignee": {"type": "string", "description": "Filter by assignee ('currentUser()' or account ID)"},
             "max_results": {"type": "integer", "description": "Max results (default 20)", "maximum": 100},
+            "fetch_all": {
+                "type": "boolean",
+                "description": "Fetch every matching issue across pages (ignores max_results)",
+            },
         },
     }
 
@@ -183,14 +212,17 @@ class JiraListIssuesTool(Tool):
             jql += " ORDER BY updated DESC"
 
         try:
+            if kwargs.get("fetch_all"):
+                issues = [_format_issue(i) async for i in self._client.paginate(jql)]
+                return json.dumps({"total": len(issues), "issues": issues})
             data = await self._client.get(
                 "/rest/api/3/search/jql",
                 params={"jql": jql, "maxResults": kwargs.get("max_results", 20)},
             )
             issues = [_format_issue(i) for i in data.get("issues", [])]
-            return json.dumps({"total": data.get("total", 0), "issues": issues}, default=str)
+            return json.dumps({"total": data.get("total", 0), "issues": issues})
         except httpx.HTTPStatusError as e:
-            return f"Error {e.response.status_code}: {e.response.text[:500]}"
+            return f"Error {e.response.status_code}: {e.response.content[:500].decode('utf-8', errors='replace')}"
         except Exception as e:
             return f"Error: {e}"
 
@@ -215,9 +247,9 @@ class JiraGetIssueTool(Tool):
         key = kwargs["issue_key"]
         try:
             data = await self._client.get(f"/rest/api/3/issue/{key}")
-            return json.dumps(_format_issue(data), default=str)
+            return json.dumps(_format_issue(data))
         except httpx.HTTPStatusError as e:
-            return f"Error {e.response.status_code}: {e.response.text[:500]}"
+            return f"Error {e.response.status_code}: {e.response.content[:500].decode('utf-8', errors='replace')}"
         except Exception as e:
             return f"Error: {e}"
 
@@ -282,7 +314,7 @@ class JiraUpdateIssueTool(Tool):
 
             return " ".join(results) if results else "No changes specified."
         except httpx.HTTPStatusError as e:
-            return f"Error {e.response.status_code}: {e.response.text[:500]}"
+            return f"Error {e.response.status_code}: {e.response.content[:500].decode('utf-8', errors='replace')}"
         except Exception as e:
             return f"Error: {e}"
 
@@ -313,7 +345,7 @@ class JiraAddCommentTool(Tool):
             )
             return json.dumps({"id": result.get("id"), "created": result.get("created")})
         except httpx.HTTPStatusError as e:
-            return f"Error {e.response.status_code}: {e.response.text[:500]}"
+            return f"Error {e.response.status_code}: {e.response.content[:500].decode('utf-8', errors='replace')}"
         except Exception as e:
             return f"Error: {e}"
 
@@ -328,6 +360,10 @@ class JiraSearchTool(Tool):
         "properties": {
             "jql": {"type": "string", "description": "JQL query string"},
             "max_results": {"type": "integer", "description": "Max results (default 20)", "maximum": 100},
+            "fetch_all": {
+                "type": "boolean",
+                "description": "Fetch every matching issue across pages (ignores max_results)",
+            },
         },
         "required": ["jql"],
     }
@@ -337,13 +373,16 @@ class JiraSearchTool(Tool):
 
     async def execute(self, **kwargs: Any) -> str:
         try:
+            if kwargs.get("fetch_all"):
+                issues = [_format_issue(i) async for i in self._client.paginate(kwargs["jql"])]
+                return json.dumps({"total": len(issues), "issues": issues})
             data = await self._client.get(
                 "/rest/api/3/search/jql",
                 params={"jql": kwargs["jql"], "maxResults": kwargs.get("max_results", 20)},
             )
             issues = [_format_issue(i) for i in data.get("issues", [])]
-            return json.dumps({"total": data.get("total", 0), "issues": issues}, default=str)
+            return json.dumps({"total": data.get("total", 0), "issues": issues})
         except httpx.HTTPStatusError as e:
-            return f"Error {e.response.status_code}: {e.response.text[:500]}"
+            return f"Error {e.response.status_code}: {e.response.content[:500].decode('utf-8', errors='replace')}"
         except Exception as e:
             return f"Error: {e}"
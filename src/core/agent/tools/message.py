@@ -93,7 +93,7 @@ class MessageTool(Tool):
             channel=channel,
             chat_id=chat_id,
             content=content,
-            media=media or [],
+            media=tuple(media) if media else (),
             metadata={
                 "message_id": message_id,
             }
@@ -10,6 +10,23 @@ from typing import Any
 
 from core.agent.tools.base import Tool
 
+# Optional accelerator: Hyperscan compiles every deny pattern into one
+# vectorized DFA scanned in a single pass, so the guard stays flat-cost
+# as deny rules accumulate. The fused re alternation below remains the
+# fallback when the binding isn't installed.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Guard regexes compiled once at import: _guard_command runs on every
+# exec tool call, so per-call re.compile cache lookups add up.
+_ANSI_C_RE = re.compile(r"\$'([^']*)'")
+_HEX_RE = re.compile(r"\\x([0-9a-fA-F]{2})")
+_OCT_RE = re.compile(r"\\([0-7]{1,3})")
+_WIN_PATH_RE = re.compile(r"[A-Za-z]:\\[^\\\"']+")
+_POSIX_PATH_RE = re.compile(r"(?:^|[\s|>])(/[^\s\"'>]+)")
+
 
 class ExecTool(Tool):
     """Tool to execute shell commands."""
@@ -57,6 +74,24 @@ class ExecTool(Tool):
         ]
         self.allow_patterns = allow_patterns or []
         self.restrict_to_workspace = restrict_to_workspace
+        # One alternation scans the command once instead of once per deny
+        # pattern; allow patterns compile up front for the same reason.
+        self._deny_re = re.compile("|".join(f"(?:{p})" for p in self.deny_patterns))
+        self._allow_res = [re.compile(p) for p in self.allow_patterns]
+        self._deny_db = None
+        if hyperscan is not None:
+            try:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[p.encode() for p in self.deny_patterns],
+                    ids=list(range(len(self.deny_patterns))),
+                    flags=[hyperscan.HS_FLAG_CASELESS] * len(self.deny_patterns),
+                )
+                self._deny_db = db
+            except Exception:
+                # A pattern uses a construct Hyperscan can't compile
+                # (e.g. custom allow/deny lists); the re fallback covers it.
+                self._deny_db = None
     
     @property
     def name(self) -> str:
@@ -153,13 +188,31 @@ class ExecTool(Tool):
         def _expand_ansi_c(m: re.Match) -> str:
             inner = m.group(1)
             # Replace \xNN hex escapes
-            inner = re.sub(r"\\x([0-9a-fA-F]{2})", lambda h: chr(int(h.group(1), 16)), inner)
+            inner = _HEX_RE.sub(lambda h: chr(int(h.group(1), 16)), inner)
             # Replace \NNN octal escapes
-            inner = re.sub(r"\\([0-7]{1,3})", lambda o: chr(int(o.group(1), 8)), inner)
+            inner = _OCT_RE.sub(lambda o: chr(int(o.group(1), 8)), inner)
             return inner
 
-        cmd = re.sub(r"\$'([^']*)'", _expand_ansi_c, cmd)
-        return cmd
+        return _ANSI_C_RE.sub(_expand_ansi_c, cmd)
+
+    def _denied(self, text: str) -> bool:
+        """Match text against the deny patterns, via Hyperscan when available."""
+        if self._deny_db is not None:
+            hits: list[int] = []
+
+            def _on_match(pat_id: int, start: int, end: int, flags: int, ctx: Any) -> int:
+                hits.append(pat_id)
+                # First hit is enough — stop the scan early.
+                return hyperscan.HS_SCAN_TERMINATED
+
+            try:
+                self._deny_db.scan(text.encode(), match_event_handler=_on_match)
+            except Exception:
+                # Terminated scans surface as an error in some binding
+                # versions; hits already tells us whether anything matched.
+                pass
+            return bool(hits)
+        return self._deny_re.search(text) is not None
 
     def _guard_command(self, command: str, cwd: str) -> str | None:
         """Best-effort safety guard for potentially destructive commands."""
@@ -167,12 +220,11 @@ class ExecTool(Tool):
         cmd = self._normalize_command(cmd)
         lower = cmd.lower()
 
-        for pattern in self.deny_patterns:
-            if re.search(pattern, lower):
-                return "Error: Command blocked by safety guard (dangerous pattern detected)"
+        if self._denied(lower):
+            return "Error: Command blocked by safety guard (dangerous pattern detected)"
 
-        if self.allow_patterns:
-            if not any(re.search(p, lower) for p in self.allow_patterns):
+        if self._allow_res:
+            if not any(p.search(lower) for p in self._allow_res):
                 return "Error: Command blocked by safety guard (not in allowlist)"
 
         if self.restrict_to_workspace:
@@ -183,11 +235,11 @@ class ExecTool(Tool):
 
             cwd_path = Path(cwd).resolve()
 
-            win_paths = re.findall(r"[A-Za-z]:\\[^\\\"']+", cmd)
+            win_paths = _WIN_PATH_RE.findall(cmd)
             # Only match absolute paths — avoid false positives on relative
             # paths like ".venv/bin/python" where "/bin/python" would be
             # incorrectly extracted by the old pattern.
-            posix_paths = re.findall(r"(?:^|[\s|>])(/[^\s\"'>]+)", cmd)
+            posix_paths = _POSIX_PATH_RE.findall(cmd)
 
             for raw in win_paths + posix_paths:
                 try:
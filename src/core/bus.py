@@ -1,76 +0,0 @@
-"""Message bus: event types and async queue for decoupled channel-agent communication."""
-
-import asyncio
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any
-
-
-@dataclass
-class InboundMessage:
-    """Message received from a chat channel."""
-
-    channel: str  # telegram, discord, slack, whatsapp
-    sender_id: str  # User identifier
-    chat_id: str  # Chat/channel identifier
-    content: str  # Message text
-    timestamp: datetime = field(default_factory=datetime.now)
-    media: list[str] = field(default_factory=list)  # Media URLs
-    metadata: dict[str, Any] = field(default_factory=dict)  # Channel-specific data
-    session_key_override: str | None = None  # Optional override for thread-scoped sessions
-
-    @property
-    def session_key(self) -> str:
-        """Unique key for session identification."""
-        return self.session_key_override or f"{self.channel}:{self.chat_id}"
-
-
-@dataclass
-class OutboundMessage:
-    """Message to send to a chat channel."""
-
-    channel: str
-    chat_id: str
-    content: str
-    reply_to: str | None = None
-    media: list[str] = field(default_factory=list)
-    metadata: dict[str, Any] = field(default_factory=dict)
-
-
-class MessageBus:
-    """
-    Async message bus that decouples chat channels from the agent core.
-
-    Channels push messages to the inbound queue, and the agent processes
-    them and pushes responses to the outbound queue.
-    """
-
-    def __init__(self):
-        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue()
-        self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
-
-    async def publish_inbound(self, msg: InboundMessage) -> None:
-        """Publish a message from a channel to the agent."""
-        await self.inbound.put(msg)
-
-    async def consume_inbound(self) -> InboundMessage:
-        """Consume the next inbound message (blocks until available)."""
-        return await self.inbound.get()
-
-    async def publish_outbound(self, msg: OutboundMessage) -> None:
-        """Publish a response from the agent to channels."""
-        await self.outbound.put(msg)
-
-    async def consume_outbound(self) -> OutboundMessage:
-        """Consume the next outbound message (blocks until available)."""
-        return await self.outbound.get()
-
-    @property
-    def inbound_size(self) -> int:
-        """Number of pending inbound messages."""
-        return self.inbound.qsize()
-
-    @property
-    def outbound_size(self) -> int:
-        """Number of pending outbound messages."""
-        return self.outbound.qsize()
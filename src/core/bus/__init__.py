@@ -0,0 +1,19 @@
+"""Message bus: event types and async queue for decoupled channel-agent communication."""
+
+from core.bus.events import (
+    InboundMessage,
+    OutboundMessage,
+    ensure_media,
+    ensure_metadata,
+)
+from core.bus.queue import MessageBus, SoAView, SPSCBus
+
+__all__ = [
+    "InboundMessage",
+    "OutboundMessage",
+    "MessageBus",
+    "SPSCBus",
+    "SoAView",
+    "ensure_media",
+    "ensure_metadata",
+]
@@ -0,0 +1,259 @@
+"""Event types carried over the message bus."""
+
+import sys
+import time
+import types
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# Shared empty sentinels: the common text-only message leaves media and
+# metadata untouched, so defaulting to these avoids allocating a fresh
+# list and dict per message. Use ensure_media/ensure_metadata to mutate.
+_EMPTY_MEDIA: tuple[str, ...] = ()
+_EMPTY_MAP: Mapping[str, Any] = types.MappingProxyType({})
+
+# session_key strings keyed by (channel, chat_id): the f-string is paid
+# once per unique chat, not once per message. Bounded so long-running
+# processes with churning chats can't grow it forever.
+_SK_CACHE: dict[tuple[str, str], str] = {}
+_SK_CACHE_MAX = 4096
+
+
+def _session_key_for(channel: str, chat_id: str) -> str:
+    key = (channel, chat_id)
+    sk = _SK_CACHE.get(key)
+    if sk is None:
+        if len(_SK_CACHE) >= _SK_CACHE_MAX:
+            # Oldest-inserted eviction is enough here; dicts keep insertion order
+            del _SK_CACHE[next(iter(_SK_CACHE))]
+        sk = sys.intern(f"{channel}:{chat_id}")
+        _SK_CACHE[key] = sk
+    return sk
+
+
+# Recycled InboundMessage instances: chat bursts allocate and free
+# same-sized message objects at the same rate, so reusing released
+# instances bypasses the allocator on the hot path. Bounded so an idle
+# process doesn't pin a burst's worth of objects forever.
+_FREELIST: list["InboundMessage"] = []
+_FREELIST_MAX = 1024
+
+
+@dataclass(slots=True, frozen=True)
+class InboundMessage:
+    """Message received from a chat channel.
+
+    Frozen and slotted: instances are immutable, so channels must build
+    ``media``/``metadata`` before construction (they already do).
+    """
+
+    channel: str  # telegram, discord, slack, whatsapp
+    sender_id: str  # User identifier
+    chat_id: str  # Chat/channel identifier
+    content: str  # Message text
+    timestamp_ns: int = field(default_factory=time.time_ns)  # Arrival time, epoch ns
+    media: tuple[str, ...] = _EMPTY_MEDIA  # Media URLs
+    metadata: dict[str, Any] = field(default_factory=lambda: _EMPTY_MAP)  # Channel-specific data
+    session_key_override: str | None = None  # Optional override for thread-scoped sessions
+    _session_key: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Channel names come from a tiny closed set and chat ids repeat for
+        # the life of a session; interning makes downstream == and dict
+        # lookups pointer comparisons.
+        object.__setattr__(self, "channel", sys.intern(self.channel))
+        object.__setattr__(self, "chat_id", sys.intern(self.chat_id))
+        if type(self.media) is list:  # adapters may still hand over a build list
+            object.__setattr__(self, "media", tuple(self.media))
+        # Routing touches the key several times per message; resolve it once
+        # here (override folded in), hitting the per-chat cache on repeat
+        # messages so the property is a branchless read.
+        object.__setattr__(
+            self,
+            "_session_key",
+            self.session_key_override or _session_key_for(self.channel, self.chat_id),
+        )
+
+    @classmethod
+    def make(
+        cls,
+        channel: str,
+        sender_id: str,
+        chat_id: str,
+        content: str,
+        media: tuple[str, ...] = _EMPTY_MEDIA,
+        metadata: dict[str, Any] = _EMPTY_MAP,
+        session_key_override: str | None = None,
+    ) -> "InboundMessage":
+        """Fast constructor for the channel hot path.
+
+        Writes the slots directly via object.__setattr__, skipping the
+        generated __init__'s keyword binding and default_factory calls.
+        Reuses a released instance from the freelist when one is available.
+        """
+        self = _FREELIST.pop() if _FREELIST else object.__new__(cls)
+        set_ = object.__setattr__
+        channel = sys.intern(channel)
+        chat_id = sys.intern(chat_id)
+        set_(self, "channel", channel)
+        set_(self, "sender_id", sender_id)
+        set_(self, "chat_id", chat_id)
+        set_(self, "content", content)
+        set_(self, "timestamp_ns", time.time_ns())
+        set_(self, "media", tuple(media) if type(media) is list else media)
+        set_(self, "metadata", metadata)
+        set_(self, "session_key_override", session_key_override)
+        set_(self, "_session_key", session_key_override or _session_key_for(channel, chat_id))
+        return self
+
+    @classmethod
+    def _reconstruct(
+        cls,
+        channel: str,
+        sender_id: str,
+        chat_id: str,
+        content: str,
+        timestamp_ns: int,
+        media: tuple[str, ...] | None,
+        metadata: dict[str, Any] | None,
+        session_key_override: str | None,
+    ) -> "InboundMessage":
+        """Rebuild from the flat tuple emitted by __reduce__."""
+        self = _FREELIST.pop() if _FREELIST else object.__new__(cls)
+        set_ = object.__setattr__
+        channel = sys.intern(channel)
+        chat_id = sys.intern(chat_id)
+        set_(self, "channel", channel)
+        set_(self, "sender_id", sender_id)
+        set_(self, "chat_id", chat_id)
+        set_(self, "content", content)
+        set_(self, "timestamp_ns", timestamp_ns)
+        set_(self, "media", media if media is not None else _EMPTY_MEDIA)
+        set_(self, "metadata", metadata if metadata is not None else _EMPTY_MAP)
+        set_(self, "session_key_override", session_key_override)
+        set_(self, "_session_key", session_key_override or _session_key_for(channel, chat_id))
+        return self
+
+    def __reduce__(self):
+        # Flat tuple instead of dataclass field-discovery pickling; empty
+        # sentinels travel as None so no empty containers hit the stream.
+        return (
+            InboundMessage._reconstruct,
+            (
+                self.channel,
+                self.sender_id,
+                self.chat_id,
+                self.content,
+                self.timestamp_ns,
+                self.media or None,
+                self.metadata or None,
+                self.session_key_override,
+            ),
+        )
+
+    def _release(self) -> None:
+        """Return this instance to the freelist once processing is done.
+
+        Only the consumer that owns the message may call this; any slot
+        value it wants to keep (e.g. the metadata dict) must be referenced
+        elsewhere first. Payload slots are cleared so a parked instance
+        doesn't pin large strings or containers.
+        """
+        if len(_FREELIST) < _FREELIST_MAX:
+            set_ = object.__setattr__
+            set_(self, "content", "")
+            set_(self, "media", _EMPTY_MEDIA)
+            set_(self, "metadata", _EMPTY_MAP)
+            _FREELIST.append(self)
+
+    @property
+    def session_key(self) -> str:
+        """Unique key for session identification."""
+        return self._session_key
+
+    @property
+    def timestamp(self) -> "datetime":
+        """Arrival time as a datetime, derived from the stored epoch ns."""
+        # Imported lazily: nothing on the bus hot path needs datetime, so
+        # the module graph stays out of bus import time.
+        from datetime import datetime
+
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
+
+@dataclass(slots=True, frozen=True)
+class OutboundMessage:
+    """Message to send to a chat channel."""
+
+    channel: str
+    chat_id: str
+    content: str
+    reply_to: str | None = None
+    media: tuple[str, ...] = _EMPTY_MEDIA
+    metadata: dict[str, Any] = field(default_factory=lambda: _EMPTY_MAP)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "channel", sys.intern(self.channel))
+        object.__setattr__(self, "chat_id", sys.intern(self.chat_id))
+        if type(self.media) is list:  # adapters may still hand over a build list
+            object.__setattr__(self, "media", tuple(self.media))
+
+    @classmethod
+    def _reconstruct(
+        cls,
+        channel: str,
+        chat_id: str,
+        content: str,
+        reply_to: str | None,
+        media: tuple[str, ...] | None,
+        metadata: dict[str, Any] | None,
+    ) -> "OutboundMessage":
+        """Rebuild from the flat tuple emitted by __reduce__."""
+        self = object.__new__(cls)
+        set_ = object.__setattr__
+        set_(self, "channel", sys.intern(channel))
+        set_(self, "chat_id", sys.intern(chat_id))
+        set_(self, "content", content)
+        set_(self, "reply_to", reply_to)
+        set_(self, "media", media if media is not None else _EMPTY_MEDIA)
+        set_(self, "metadata", metadata if metadata is not None else _EMPTY_MAP)
+        return self
+
+    def __reduce__(self):
+        return (
+            OutboundMessage._reconstruct,
+            (
+                self.channel,
+                self.chat_id,
+                self.content,
+                self.reply_to,
+                self.media or None,
+                self.metadata or None,
+            ),
+        )
+
+
+def ensure_media(msg: InboundMessage | OutboundMessage) -> list[str]:
+    """Return msg.media as a mutable build list, converting in place if needed.
+
+    The empty sentinel and any already-collected tuple are both replaced
+    with a list so appends always work. Only for incremental construction
+    before the message is published; published messages carry media as an
+    immutable tuple (restored by __post_init__/make on the next build).
+    """
+    media = msg.media
+    if type(media) is not list:
+        media = list(media)
+        object.__setattr__(msg, "media", media)
+    return media
+
+
+def ensure_metadata(msg: InboundMessage | OutboundMessage) -> dict[str, Any]:
+    """Return msg.metadata as a mutable dict, materializing it if still the sentinel."""
+    if msg.metadata is _EMPTY_MAP:
+        object.__setattr__(msg, "metadata", {})
+    return msg.metadata
@@ -0,0 +1,353 @@
+"""Async queues that carry bus events between channels and the agent."""
+
+import asyncio
+from array import array
+from collections import deque
+from typing import Any, NamedTuple
+
+from core.bus.events import InboundMessage, OutboundMessage
+
+
+class SoAView(NamedTuple):
+    """Structure-of-arrays snapshot of pending inbound messages.
+
+    Parallel sequences indexed together, so bulk passes that only touch
+    one or two fields (dedupe by sender, scan content) walk contiguous
+    arrays instead of pointer-chasing through dataclass instances.
+    """
+
+    channels: list[str]
+    sender_ids: list[str]
+    contents: list[str]
+    timestamps_ns: array  # array('q') of epoch ns
+
+
+class MessageBus:
+    """
+    Async message bus that decouples chat channels from the agent core.
+
+    Channels push messages to the inbound queue, and the agent processes
+    them and pushes responses to the outbound queue.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        # Plain deques with one wakeup Event each: append/popleft allocate
+        # nothing, unlike asyncio.Queue which builds a Future per operation.
+        # maxsize bounds each queue so a replaying channel can't grow memory
+        # without limit; publishers await free space instead.
+        self._maxsize = maxsize
+        # Captured for publish_inbound_threadsafe; refreshed by consumers,
+        # which always run on the loop.
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self._inbound: deque[InboundMessage] = deque()
+        self._inbound_count = 0  # bare int mirror of len(_inbound) for hot reads
+        self._inbound_ev = asyncio.Event()
+        self._inbound_space_ev = asyncio.Event()
+        self._inbound_space_ev.set()
+        self._outbound: deque[OutboundMessage] = deque()
+        self._outbound_count = 0
+        self._outbound_ev = asyncio.Event()
+        self._outbound_space_ev = asyncio.Event()
+        self._outbound_space_ev.set()
+
+    async def publish_inbound(self, msg: InboundMessage) -> None:
+        """Publish a message from a channel to the agent (awaits if full)."""
+        while self._inbound_count >= self._maxsize:
+            self._inbound_space_ev.clear()
+            await self._inbound_space_ev.wait()
+        self._inbound.append(msg)
+        self._inbound_count += 1
+        self._inbound_ev.set()
+
+    def _deposit_inbound(self, msg: InboundMessage) -> None:
+        """Append + wake, scheduled on the loop by the threadsafe path."""
+        self._inbound.append(msg)
+        self._inbound_count += 1
+        self._inbound_ev.set()
+
+    def publish_inbound_threadsafe(self, msg: InboundMessage) -> None:
+        """Publish from a non-loop thread (e.g. an SDK callback thread).
+
+        One C-level call_soon_threadsafe enqueue — no Future round-trip
+        like run_coroutine_threadsafe. Back-pressure is not applied on
+        this path; the deposit happens on the loop regardless of maxsize.
+        """
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError(
+                "publish_inbound_threadsafe requires a running consumer; "
+                "the bus has not been used from an event loop yet"
+            )
+        loop.call_soon_threadsafe(self._deposit_inbound, msg)
+
+    async def consume_inbound(self) -> InboundMessage:
+        """Consume the next inbound message (blocks until available)."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        while not self._inbound:
+            self._inbound_ev.clear()
+            await self._inbound_ev.wait()
+        msg = self._inbound.popleft()
+        self._inbound_count -= 1
+        self._inbound_space_ev.set()
+        return msg
+
+    async def publish_outbound(self, msg: OutboundMessage) -> None:
+        """Publish a response from the agent to channels (awaits if full)."""
+        while self._outbound_count >= self._maxsize:
+            self._outbound_space_ev.clear()
+            await self._outbound_space_ev.wait()
+        self._outbound.append(msg)
+        self._outbound_count += 1
+        self._outbound_ev.set()
+
+    async def consume_outbound(self) -> OutboundMessage:
+        """Consume the next outbound message (blocks until available)."""
+        while not self._outbound:
+            self._outbound_ev.clear()
+            await self._outbound_ev.wait()
+        msg = self._outbound.popleft()
+        self._outbound_count -= 1
+        self._outbound_space_ev.set()
+        return msg
+
+    async def reply(
+        self,
+        channel: str,
+        chat_id: str,
+        content: str,
+        reply_to: str | None = None,
+    ) -> None:
+        """Fast path for the common text-only reply.
+
+        Builds the OutboundMessage via _reconstruct (no kwarg binding, no
+        default factories, shared empty sentinels) and enqueues it.
+        """
+        msg = OutboundMessage._reconstruct(channel, chat_id, content, reply_to, None, None)
+        while self._outbound_count >= self._maxsize:
+            self._outbound_space_ev.clear()
+            await self._outbound_space_ev.wait()
+        self._outbound.append(msg)
+        self._outbound_count += 1
+        self._outbound_ev.set()
+
+    async def drain_inbound(self, max_n: int = 256) -> list[InboundMessage]:
+        """Consume every queued inbound message (up to max_n) in one await.
+
+        Blocks only while the queue is empty, amortizing the event-loop
+        round-trip over the whole batch instead of paying it per message.
+        """
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        while not self._inbound:
+            self._inbound_ev.clear()
+            await self._inbound_ev.wait()
+        n = min(self._inbound_count, max_n)
+        popleft = self._inbound.popleft
+        out = [popleft() for _ in range(n)]
+        self._inbound_count -= n
+        self._inbound_space_ev.set()
+        return out
+
+    async def drain_outbound(self, max_n: int = 256) -> list[OutboundMessage]:
+        """Consume every queued outbound message (up to max_n) in one await."""
+        while not self._outbound:
+            self._outbound_ev.clear()
+            await self._outbound_ev.wait()
+        n = min(self._outbound_count, max_n)
+        popleft = self._outbound.popleft
+        out = [popleft() for _ in range(n)]
+        self._outbound_count -= n
+        self._outbound_space_ev.set()
+        return out
+
+    async def _in_loop(self, handler) -> None:
+        while True:
+            for msg in await self.drain_inbound():
+                await handler(msg)
+
+    async def _out_loop(self, handler) -> None:
+        while True:
+            for msg in await self.drain_outbound():
+                await handler(msg)
+
+    async def run(self, inbound_handler, outbound_handler) -> None:
+        """Drive both directions with independent consumer tasks.
+
+        Each handler must be a coroutine function taking one message; the
+        two loops use the batched drain APIs and run under asyncio.gather,
+        so a slow direction never stalls the other. Runs until cancelled.
+        """
+        # Capture the live loop up front so publish_inbound_threadsafe works
+        # even when the bus was constructed outside the loop and the
+        # consumers only ever touch the drain APIs.
+        self._loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            self._in_loop(inbound_handler),
+            self._out_loop(outbound_handler),
+        )
+
+    def batch_view(self) -> SoAView:
+        """Snapshot pending inbound messages as parallel flat arrays.
+
+        Built on demand rather than maintained per publish, so the common
+        one-message-at-a-time path pays nothing for it.
+        """
+        pending = self._inbound
+        return SoAView(
+            channels=[m.channel for m in pending],
+            sender_ids=[m.sender_id for m in pending],
+            contents=[m.content for m in pending],
+            timestamps_ns=array("q", (m.timestamp_ns for m in pending)),
+        )
+
+    @property
+    def inbound_size(self) -> int:
+        """Number of pending inbound messages."""
+        return self._inbound_count
+
+    @property
+    def outbound_size(self) -> int:
+        """Number of pending outbound messages."""
+        return self._outbound_count
+
+    @property
+    def is_inbound_full(self) -> bool:
+        """Whether the inbound queue is at capacity (publishers will block)."""
+        return self._inbound_count >= self._maxsize
+
+
+class _SPSCRing:
+    """Fixed-capacity single-producer/single-consumer ring of message slots.
+
+    The ring is a preallocated list indexed by free-running head/tail
+    counters, so steady-state publish/consume allocates nothing. Safe for
+    one producer coroutine and one consumer coroutine; asyncio's
+    cooperative scheduling provides the ordering an SPSC design needs.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._ring: list[Any] = [None] * capacity
+        self._cap = capacity
+        self._head = 0  # next slot to read
+        self._tail = 0  # next slot to write
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    async def put(self, item: Any) -> None:
+        while self._tail - self._head >= self._cap:
+            self._writable.clear()
+            await self._writable.wait()
+        self._ring[self._tail % self._cap] = item
+        self._tail += 1
+        self._readable.set()
+
+    async def get(self) -> Any:
+        while self._head == self._tail:
+            self._readable.clear()
+            await self._readable.wait()
+        idx = self._head % self._cap
+        item = self._ring[idx]
+        self._ring[idx] = None  # drop the ref so consumed messages can be freed
+        self._head += 1
+        self._writable.set()
+        return item
+
+    def pending(self) -> list[Any]:
+        """Snapshot the queued items in FIFO order without consuming them."""
+        return [self._ring[i % self._cap] for i in range(self._head, self._tail)]
+
+
+class SPSCBus(MessageBus):
+    """MessageBus variant for single-agent deployments.
+
+    Backed by fixed-capacity rings instead of unbounded deques: one agent
+    consumer and one dispatcher consumer make each direction effectively
+    single-producer/single-consumer, so the ring's index-bump publish path
+    beats the general queue. Capacity doubles as back-pressure — publishers
+    await a free slot when the ring is full.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._in_ring = _SPSCRing(capacity)
+        self._out_ring = _SPSCRing(capacity)
+
+    def publish_inbound_threadsafe(self, msg: InboundMessage) -> None:
+        """Not supported: the ring assumes a single producer coroutine."""
+        raise NotImplementedError(
+            "SPSCBus is single-producer; use MessageBus for threaded publishers"
+        )
+
+    async def publish_inbound(self, msg: InboundMessage) -> None:
+        """Publish a message from a channel to the agent."""
+        await self._in_ring.put(msg)
+
+    async def consume_inbound(self) -> InboundMessage:
+        """Consume the next inbound message (blocks until available)."""
+        return await self._in_ring.get()
+
+    async def publish_outbound(self, msg: OutboundMessage) -> None:
+        """Publish a response from the agent to channels."""
+        await self._out_ring.put(msg)
+
+    async def consume_outbound(self) -> OutboundMessage:
+        """Consume the next outbound message (blocks until available)."""
+        return await self._out_ring.get()
+
+    async def reply(
+        self,
+        channel: str,
+        chat_id: str,
+        content: str,
+        reply_to: str | None = None,
+    ) -> None:
+        """Fast path for the common text-only reply."""
+        await self._out_ring.put(
+            OutboundMessage._reconstruct(channel, chat_id, content, reply_to, None, None)
+        )
+
+    async def drain_inbound(self, max_n: int = 256) -> list[InboundMessage]:
+        """Consume queued inbound messages (up to max_n) in one await."""
+        out = [await self._in_ring.get()]
+        while len(self._in_ring) and len(out) < max_n:
+            out.append(await self._in_ring.get())
+        return out
+
+    async def drain_outbound(self, max_n: int = 256) -> list[OutboundMessage]:
+        """Consume queued outbound messages (up to max_n) in one await."""
+        out = [await self._out_ring.get()]
+        while len(self._out_ring) and len(out) < max_n:
+            out.append(await self._out_ring.get())
+        return out
+
+    def batch_view(self) -> SoAView:
+        """Snapshot pending inbound messages as parallel flat arrays."""
+        pending = self._in_ring.pending()
+        return SoAView(
+            channels=[m.channel for m in pending],
+            sender_ids=[m.sender_id for m in pending],
+            contents=[m.content for m in pending],
+            timestamps_ns=array("q", (m.timestamp_ns for m in pending)),
+        )
+
+    @property
+    def inbound_size(self) -> int:
+        """Number of pending inbound messages."""
+        return len(self._in_ring)
+
+    @property
+    def outbound_size(self) -> int:
+        """Number of pending outbound messages."""
+        return len(self._out_ring)
+
+    @property
+    def is_inbound_full(self) -> bool:
+        """Whether the inbound ring is at capacity (publishers will block)."""
+        return len(self._in_ring) >= self._in_ring._cap
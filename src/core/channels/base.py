@@ -121,14 +121,19 @@ class BaseChannel(ABC):
             )
             return
         
-        msg = InboundMessage(
-            channel=self.name,
-            sender_id=str(sender_id),
-            chat_id=str(chat_id),
-            content=content,
-            media=media or [],
-            metadata=metadata or {},
+        # Omit media/metadata when empty so the shared sentinel defaults apply
+        extra: dict[str, Any] = {}
+        if media:
+            extra["media"] = media
+        if metadata:
+            extra["metadata"] = metadata
+        msg = InboundMessage.make(
+            self.name,
+            str(sender_id),
+            str(chat_id),
+            content,
             session_key_override=session_key,
+            **extra,
         )
         
         await self.bus.publish_inbound(msg)
@@ -142,17 +142,23 @@ class ChannelManager:
         
         while True:
             try:
-                msg = await asyncio.wait_for(
-                    self.bus.consume_outbound(),
+                # Drain in batches so one await covers a whole burst of replies
+                msgs = await asyncio.wait_for(
+                    self.bus.drain_outbound(),
                     timeout=1.0
                 )
-                
+            except asyncio.TimeoutError:
+                continue
+            except asyncio.CancelledError:
+                break
+
+            for msg in msgs:
                 if msg.metadata.get("_progress"):
                     if msg.metadata.get("_tool_hint") and not self.config.channels.send_tool_hints:
                         continue
                     if not msg.metadata.get("_tool_hint") and not self.config.channels.send_progress:
                         continue
-                
+
                 channel = self.channels.get(msg.channel)
                 if channel:
                     try:
@@ -161,11 +167,6 @@ class ChannelManager:
                         logger.error("Error sending to {}: {}", msg.channel, e)
                 else:
                     logger.warning("Unknown channel: {}", msg.channel)
-                    
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
     
     def get_channel(self, name: str) -> BaseChannel | None:
         """Get a channel by name."""
@@ -625,10 +625,10 @@ def agent(
                         turn_response.clear()
 
                         await bus.publish_inbound(InboundMessage(
-                            channel=cli_channel,
-                            sender_id="user",
-                            chat_id=cli_chat_id,
-                            content=user_input,
+                            cli_channel,
+                            "user",
+                            cli_chat_id,
+                            user_input,
                         ))
 
                         with _thinking_ctx():
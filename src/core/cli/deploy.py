@@ -9,7 +9,10 @@ plus per-instance stacks (Lightsail, disk, static IP, instance secret).
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
+import hashlib
 import json
 import os
 import shutil
@@ -19,6 +22,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import httpx
+import orjson
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
@@ -57,6 +61,44 @@ def _run(cmd: list[str], *, check: bool = True, capture: bool = False, input: by
     return subprocess.run(cmd, check=check, input=input, **kw)
 
 
+async def _run_async(
+    cmd: list[str],
+    *,
+    check: bool = True,
+    capture: bool = False,
+    input: bytes | None = None,
+    cwd: Path | str | None = None,
+) -> subprocess.CompletedProcess:
+    """Async counterpart of _run; lets callers gather independent commands."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=asyncio.subprocess.PIPE if capture else None,
+        stderr=asyncio.subprocess.PIPE if capture else None,
+        cwd=cwd,
+    )
+    stdout, stderr = await proc.communicate(input)
+    result = subprocess.CompletedProcess(
+        cmd,
+        proc.returncode,
+        stdout.decode() if stdout is not None else None,
+        stderr.decode() if stderr is not None else None,
+    )
+    if check and proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, result.stdout, result.stderr)
+    return result
+
+
+# Multiplex every ssh/scp call over one persistent TCP+SSH session instead
+# of paying a fresh handshake per command (the polling loops below used to
+# open 30+ of them).
+_SSH_MUX_OPTS = [
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/cm-%r@%h:%p",
+    "-o", "ControlPersist=60s",
+]
+
+
 def _prompt_optional(label: str, *, password: bool = False, existing: str | None = None) -> str:
     """Prompt for an optional value. Empty string = skip."""
     hint = ""
@@ -69,15 +111,24 @@ def _prompt_optional(label: str, *, password: bool = False, existing: str | None
     return val
 
 
+@functools.lru_cache(maxsize=None)
+def _which(tool: str) -> bool:
+    """Memoized shutil.which: each lookup walks and stats every PATH entry,
+    and the answers don't change within a process."""
+    return shutil.which(tool) is not None
+
+
 def _comma_to_list(s: str) -> list[str]:
     return [x.strip() for x in s.split(",") if x.strip()] if s else []
 
 
-def _get_cf_outputs(stack_name: str, region: str) -> dict[str, str]:
-    """Fetch CloudFormation stack outputs as {key: value}."""
-    import boto3
+def _secret_hash(data: dict) -> bytes:
+    """Stable digest of a secret payload, for change detection before upload."""
+    return hashlib.sha256(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).digest()
 
-    cf = boto3.client("cloudformation", region_name=region)
+
+def _get_cf_outputs(cf, stack_name: str) -> dict[str, str]:
+    """Fetch CloudFormation stack outputs as {key: value}."""
     resp = cf.describe_stacks(StackName=stack_name)
     outputs = resp["Stacks"][0].get("Outputs", [])
     return {o["OutputKey"]: o["OutputValue"] for o in outputs}
@@ -111,19 +162,121 @@ class DeployFlow:
         self.with_workspace = with_workspace
 
         self.instance_stack_name = f"Nanobot-{instance}"
-        self.state = _load_state(instance)
+        self._state: dict | None = None  # loaded on first access, see state
+        self._state_dirty = False
         self.org_secrets: dict = {}
         self.instance_secrets: dict = {}
+        self._sm_cache = None  # lazy SecretCache, see _get_secret_string
+        self._remote_secret_hashes: dict[str, bytes] = {}  # what Secrets Manager already holds
+        self._cf_cache: dict[str, dict[str, str]] = {}  # stack outputs, one DescribeStacks per run
+
+        # One session + one client per service for the whole run. Each
+        # boto3.client() call re-parses the service model JSON; the phases
+        # used to pay that repeatedly for the same four services.
+        import boto3
+
+        self._session = boto3.session.Session(region_name=region)
+        self.sm = self._session.client("secretsmanager")
+        self.cf = self._session.client("cloudformation")
+        self.ecr = self._session.client("ecr")
+        self.sts = self._session.client("sts")
 
         # Project root = repo root (where Dockerfile lives)
         self.project_root = Path(__file__).resolve().parent.parent.parent
         self.infra_dir = self.project_root / "infra"
 
+    @property
+    def state(self) -> dict:
+        """Deploy state, read from disk on first access."""
+        if self._state is None:
+            self._state = _load_state(self.instance)
+        return self._state
+
+    def _mark_state_dirty(self) -> None:
+        """Record that state changed; the actual write happens in _flush_state.
+
+        Phases used to rewrite the whole state file after every mutation;
+        batching them behind a dirty flag turns a run's half-dozen writes
+        into one.
+        """
+        self._state_dirty = True
+
+    def _flush_state(self) -> None:
+        if self._state_dirty and self._state is not None:
+            _save_state(self.instance, self._state)
+            self._state_dirty = False
+
+    def _stack_known(self, stack_name: str) -> bool:
+        """Whether local state has recorded a deploy of this stack."""
+        return bool(self.state.get(f"{stack_name}_last_deploy"))
+
+    def _stack_deployed(self, stack_name: str) -> bool:
+        """Ask CloudFormation whether the stack exists (state-miss fallback)."""
+        try:
+            self.cf.describe_stacks(StackName=stack_name)
+            return True
+        except self.cf.exceptions.ClientError:
+            return False
+
+    def _outputs(self, stack_name: str) -> dict[str, str]:
+        """Stack outputs with one DescribeStacks per stack per run.
+
+        Phases 3-5 re-resolve the same shared/instance outputs; the cache
+        keeps that to a single API hit each, with self.state persisting
+        the interesting values across runs.
+        """
+        cached = self._cf_cache.get(stack_name)
+        if cached is None:
+            cached = _get_cf_outputs(self.cf, stack_name)
+            self._cf_cache[stack_name] = cached
+        return cached
+
+    # ------------------------------------------------------------------
+    # Secrets Manager access
+    # ------------------------------------------------------------------
+
+    def _get_secret_string(self, secret_id: str) -> str:
+        """Read a secret, using the client-side SecretCache when installed.
+
+        Repeated reads within one run hit the in-process TTL cache instead
+        of the network; without the optional aws-secretsmanager-caching
+        dependency this falls through to a plain get_secret_value.
+        """
+        if self._sm_cache is None:
+            try:
+                from aws_secretsmanager_caching import SecretCache, SecretCacheConfig
+
+                self._sm_cache = SecretCache(
+                    config=SecretCacheConfig(max_cache_size=8, secret_refresh_interval=3600),
+                    client=self.sm,
+                )
+            except ImportError:
+                self._sm_cache = False
+        if self._sm_cache:
+            return self._sm_cache.get_secret_string(secret_id)
+        return self.sm.get_secret_value(SecretId=secret_id)["SecretString"]
+
+    def _invalidate_secret(self, secret_id: str) -> None:
+        """Drop the cached value after an upload so re-reads see the new one."""
+        if self._sm_cache:
+            try:
+                self._sm_cache.refresh_now(secret_id)
+            except Exception:
+                pass
+
     # ------------------------------------------------------------------
     # Main entry
     # ------------------------------------------------------------------
 
     def run(self) -> None:
+        # Whatever path the run takes (including early exits and failures),
+        # batched state mutations land on disk exactly once at the end.
+        try:
+            self._run_flow()
+        finally:
+            self._flush_state()
+
+    def _run_flow(self) -> None:
         console.print(f"\n[bold cyan]nanobot deploy[/bold cyan]  instance=[cyan]{self.instance}[/cyan]\n")
 
         if self.restart_only:
@@ -144,9 +297,32 @@ class DeployFlow:
         # Full flow
         self._phase0_prerequisites()
         self._phase1_collect_secrets()
+        image_done = False
         if not self.skip_cdk:
-            self._phase2_cdk_deploy()
-        if not self.skip_image:
+            stacks, ip_input, deploy_instance = self._phase2_prepare()
+            if (
+                not self.skip_image
+                and stacks
+                and SHARED_STACK_NAME not in stacks
+                and self.state.get("ecr_repo_uri")
+            ):
+                # The image push only needs the ECR URI (already known), not
+                # the instance stack - overlap it with the CFN deploy.
+                console.print("[dim]Overlapping image push with instance stack deploy.[/dim]")
+
+                async def _overlap() -> None:
+                    await asyncio.gather(
+                        asyncio.to_thread(self._deploy_stacks, stacks, ip_input),
+                        asyncio.to_thread(self._phase3_push_image),
+                    )
+
+                asyncio.run(_overlap())
+                image_done = True
+            elif stacks:
+                console.print(f"Deploying: {', '.join(stacks)}")
+                self._deploy_stacks(stacks, ip_input)
+            self._phase2_finish(deploy_instance)
+        if not self.skip_image and not image_done:
             self._phase3_push_image()
         self._phase4_upload_secrets()
         self._phase5_start_container()
@@ -165,18 +341,15 @@ class DeployFlow:
         table.add_column("Status")
         table.add_column("Note", style="dim")
 
-        has_node = shutil.which("node") is not None
-        has_npx = shutil.which("npx") is not None
-        has_docker = shutil.which("docker") is not None
-        has_gh = shutil.which("gh") is not None
+        has_node = _which("node")
+        has_npx = _which("npx")
+        has_docker = _which("docker")
+        has_gh = _which("gh")
 
         aws_ok = False
         aws_note = ""
         try:
-            import boto3
-
-            sts = boto3.client("sts", region_name=self.region)
-            identity = sts.get_caller_identity()
+            identity = self.sts.get_caller_identity()
             aws_ok = True
             aws_note = identity["Account"]
         except Exception as exc:
@@ -217,36 +390,50 @@ class DeployFlow:
         existing_org: dict = {}
         existing_instance: dict = {}
 
-        import boto3
-        sm = boto3.client("secretsmanager", region_name=self.region)
-
-        # Try org secret
-        try:
-            resp = sm.get_secret_value(SecretId="nanobot/org")
-            existing_org = json.loads(resp["SecretString"])
-            console.print("[dim]Loaded existing org secrets for defaults.[/dim]")
-        except Exception:
-            pass
+        # Fetch org + instance + legacy in one round-trip; missing secrets
+        # come back in resp["Errors"] and are simply treated as absent.
+        org_id = "nanobot/org"
+        instance_id = f"nanobot/instance/{self.instance}"
+        legacy_arn = self.state.get("secret_arn", "")
+        secret_ids = [org_id, instance_id] + ([legacy_arn] if legacy_arn else [])
 
-        # Try instance secret
+        existing_legacy: dict = {}
         try:
-            resp = sm.get_secret_value(SecretId=f"nanobot/instance/{self.instance}")
-            existing_instance = json.loads(resp["SecretString"])
-            console.print("[dim]Loaded existing instance secrets for defaults.[/dim]")
+            resp = self.sm.batch_get_secret_value(SecretIdList=secret_ids)
+            fetched = [
+                (sv.get("Name", ""), sv.get("SecretString", ""))
+                for sv in resp.get("SecretValues", [])
+            ]
         except Exception:
-            pass
-
-        # Fall back to legacy single secret for migration ease
-        existing_legacy: dict = {}
-        if not existing_org and not existing_instance:
-            secret_arn = self.state.get("secret_arn")
-            if secret_arn:
+            # Older botocore without the batch API: cached single reads
+            fetched = []
+            for sid in secret_ids:
                 try:
-                    resp = sm.get_secret_value(SecretId=secret_arn)
-                    existing_legacy = json.loads(resp["SecretString"])
-                    console.print("[dim]Loaded legacy nanobot/config for defaults.[/dim]")
+                    fetched.append((sid, self._get_secret_string(sid)))
                 except Exception:
                     pass
+        for name, secret_string in fetched:
+            try:
+                data = orjson.loads(secret_string)
+            except Exception:
+                continue
+            if name == org_id:
+                existing_org = data
+                self._remote_secret_hashes[org_id] = _secret_hash(data)
+                console.print("[dim]Loaded existing org secrets for defaults.[/dim]")
+            elif name == instance_id:
+                existing_instance = data
+                self._remote_secret_hashes[instance_id] = _secret_hash(data)
+                console.print("[dim]Loaded existing instance secrets for defaults.[/dim]")
+            else:
+                existing_legacy = data
+
+        # Legacy secret is only a migration fallback when the split secrets
+        # don't exist yet
+        if existing_org or existing_instance:
+            existing_legacy = {}
+        elif existing_legacy:
+            console.print("[dim]Loaded legacy nanobot/config for defaults.[/dim]")
 
         # Merge for display defaults: org < instance < legacy
         existing = {**existing_legacy, **existing_org}
@@ -418,14 +605,39 @@ class DeployFlow:
     # ------------------------------------------------------------------
 
     def _phase2_cdk_deploy(self) -> None:
-        console.rule("[bold]Phase 2: CDK Deploy")
-
-        # Detect public IP
+        stacks, ip_input, deploy_instance = self._phase2_prepare()
+        if stacks:
+            console.print(f"Deploying: {', '.join(stacks)}")
+            self._deploy_stacks(stacks, ip_input)
+        self._phase2_finish(deploy_instance)
+
+    def _detect_public_ip(self) -> str:
+        """Detect the caller's public IP, reusing a recent cached answer.
+
+        Residential/office IPs rarely change within an hour, so a state
+        entry younger than that skips the checkip round-trip entirely; the
+        live lookup keeps a short timeout since it only seeds a prompt
+        default.
+        """
+        cached = self.state.get("last_detected_ip", "")
+        if cached and time.time() - self.state.get("ip_ts", 0) < 3600:
+            return cached
         try:
-            resp = httpx.get("https://checkip.amazonaws.com", timeout=5)
+            resp = httpx.get("https://checkip.amazonaws.com", timeout=2)
             my_ip = resp.text.strip()
         except Exception:
-            my_ip = ""
+            return cached
+        if my_ip:
+            self.state["last_detected_ip"] = my_ip
+            self.state["ip_ts"] = time.time()
+            self._mark_state_dirty()
+        return my_ip
+
+    def _phase2_prepare(self) -> tuple[list[str], str, bool]:
+        """Prompt for the SSH CIDR and decide which stacks need deploying."""
+        console.rule("[bold]Phase 2: CDK Deploy")
+
+        my_ip = self._detect_public_ip()
 
         if my_ip:
             console.print(f"Detected public IP: [cyan]{my_ip}[/cyan]")
@@ -434,70 +646,109 @@ class DeployFlow:
             console.print("[red]SSH CIDR is required for CDK deploy.[/red]")
             raise SystemExit(1)
 
-        import boto3
-
-        cf = boto3.client("cloudformation", region_name=self.region)
-
-        # Deploy shared stack first (if needed)
-        shared_exists = False
-        try:
-            cf.describe_stacks(StackName=SHARED_STACK_NAME)
-            shared_exists = True
-        except cf.exceptions.ClientError:
-            pass
+        # A deploy stamp in local state answers "does this stack exist?"
+        # without a speculative DescribeStacks round-trip; the API is only
+        # consulted when state has never seen the stack.
+        shared_exists = self._stack_known(SHARED_STACK_NAME) or self._stack_deployed(SHARED_STACK_NAME)
 
+        deploy_shared = False
         if shared_exists:
             console.print("[dim]Shared stack already exists.[/dim]")
-            if Confirm.ask("Update shared stack?", default=False):
-                self._deploy_stack(SHARED_STACK_NAME, ip_input)
+            deploy_shared = Confirm.ask("Update shared stack?", default=False)
         else:
-            console.print("Deploying shared stack...")
-            self._deploy_stack(SHARED_STACK_NAME, ip_input)
-
-        # Load shared outputs
-        shared_outputs = _get_cf_outputs(SHARED_STACK_NAME, self.region)
-        self.state["ecr_repo_uri"] = shared_outputs.get("EcrRepoUri", "")
-        self.state["org_secret_arn"] = shared_outputs.get("OrgSecretArn", "")
+            deploy_shared = True
 
-        # Deploy instance stack
-        instance_exists = False
-        try:
-            cf.describe_stacks(StackName=self.instance_stack_name)
-            instance_exists = True
-        except cf.exceptions.ClientError:
-            pass
+        # Decide on the instance stack up front so both stacks can go out
+        # in one cdk invocation
+        instance_exists = (
+            self._stack_known(self.instance_stack_name)
+            or self._stack_deployed(self.instance_stack_name)
+        )
 
+        deploy_instance = True
         if instance_exists:
-            if not Confirm.ask(f"Instance stack '{self.instance_stack_name}' exists. Update?", default=True):
-                console.print("[dim]Skipping instance CDK deploy.[/dim]")
-                instance_outputs = _get_cf_outputs(self.instance_stack_name, self.region)
-                self._save_instance_outputs(instance_outputs)
-                return
+            deploy_instance = Confirm.ask(
+                f"Instance stack '{self.instance_stack_name}' exists. Update?", default=True
+            )
 
-        console.print(f"Deploying instance stack: {self.instance_stack_name}")
-        self._deploy_stack(self.instance_stack_name, ip_input)
+        stacks = ([SHARED_STACK_NAME] if deploy_shared else []) + (
+            [self.instance_stack_name] if deploy_instance else []
+        )
+        return stacks, ip_input, deploy_instance
+
+    def _phase2_finish(self, deploy_instance: bool) -> None:
+        """Refresh and persist stack outputs after the deploy."""
+        # Load shared outputs (fresh - the deploy may have changed them)
+        self._cf_cache.pop(SHARED_STACK_NAME, None)
+        self._cf_cache.pop(self.instance_stack_name, None)
+        shared_outputs = self._outputs(SHARED_STACK_NAME)
+        self.state["ecr_repo_uri"] = shared_outputs.get("EcrRepoUri", "")
+        self.state["org_secret_arn"] = shared_outputs.get("OrgSecretArn", "")
 
-        instance_outputs = _get_cf_outputs(self.instance_stack_name, self.region)
+        instance_outputs = self._outputs(self.instance_stack_name)
         self._save_instance_outputs(instance_outputs)
+        if not deploy_instance:
+            console.print("[dim]Skipped instance CDK deploy.[/dim]")
+            return
         console.print(f"\n[green]CDK deploy complete.[/green]  IP: {self.state.get('public_ip', '?')}\n")
 
-    def _deploy_stack(self, stack_name: str, ssh_cidr: str) -> None:
-        """Run CDK deploy for a specific stack."""
+    def _cdk_synth(self, ssh_cidr: str) -> Path:
+        """Synthesize the CDK app once and return the cloud assembly directory.
+
+        cdk deploy re-synthesizes the whole app (node startup, TypeScript
+        evaluation) on every invocation; deploying from a pre-built
+        assembly pays that cost once per run.
+        """
+        out_dir = self.infra_dir / ".cdk.out"
         cidrs_json = json.dumps([ssh_cidr])
         instances_json = json.dumps([self.instance])
+        result = _run(
+            [
+                "npx", "cdk", "synth",
+                "--output", str(out_dir),
+                "--context", f"sshCidrs={cidrs_json}",
+                "--context", f"instances={instances_json}",
+            ],
+            cwd=self.infra_dir,
+            check=False,
+            capture=True,
+        )
+        if result.returncode != 0:
+            console.print("[red]CDK synth failed.[/red]")
+            if result.stderr:
+                console.print(result.stderr)
+            raise SystemExit(1)
+        return out_dir
+
+    def _deploy_stacks(self, stack_names: list[str], ssh_cidr: str) -> None:
+        """Run CDK deploy for the given stacks in one invocation.
+
+        Deploys from a pre-synthesized cloud assembly (context is baked in
+        at synth time). When both stacks go out together, --concurrency 2
+        lets CDK overlap their CloudFormation polling instead of deploying
+        serially.
+        """
+        assembly = self._cdk_synth(ssh_cidr)
         cmd = [
-            "npx", "cdk", "deploy", stack_name,
+            "npx", "cdk", "deploy", *stack_names,
+            "-a", str(assembly),
             "--require-approval", "never",
-            "--context", f"sshCidrs={cidrs_json}",
-            "--context", f"instances={instances_json}",
         ]
+        if len(stack_names) > 1:
+            cmd += ["--concurrency", str(len(stack_names))]
         console.print(f"[dim]Running: {' '.join(cmd)}[/dim]\n")
 
         result = _run(cmd, cwd=self.infra_dir, check=False)
         if result.returncode != 0:
-            console.print(f"[red]CDK deploy of {stack_name} failed.[/red]")
+            console.print(f"[red]CDK deploy of {', '.join(stack_names)} failed.[/red]")
             raise SystemExit(1)
 
+        # Stamp each stack so later runs can skip the existence probe
+        now = datetime.now(timezone.utc).isoformat()
+        for name in stack_names:
+            self.state[f"{name}_last_deploy"] = now
+        self._mark_state_dirty()
+
     def _save_instance_outputs(self, outputs: dict[str, str]) -> None:
         self.state.update({
             "instance_stack_name": self.instance_stack_name,
@@ -506,7 +757,31 @@ class DeployFlow:
             "instance_secret_arn": outputs.get("InstanceSecretArn", ""),
             "last_deploy": datetime.now(timezone.utc).isoformat(),
         })
-        _save_state(self.instance, self.state)
+        self._mark_state_dirty()
+
+    def _ensure_ecr_cred_helper(self, registry: str) -> bool:
+        """Route auth for the ECR registry through docker-credential-ecr-login.
+
+        When the helper binary is installed, registering it under
+        credHelpers in ~/.docker/config.json lets docker mint tokens on
+        its own, so the explicit docker login step can be skipped.
+        """
+        if not _which("docker-credential-ecr-login"):
+            return False
+        cfg_path = Path.home() / ".docker" / "config.json"
+        try:
+            cfg = json.loads(cfg_path.read_text()) if cfg_path.exists() else {}
+        except Exception:
+            return False
+        helpers = cfg.setdefault("credHelpers", {})
+        if helpers.get(registry) != "ecr-login":
+            helpers[registry] = "ecr-login"
+            try:
+                cfg_path.parent.mkdir(parents=True, exist_ok=True)
+                cfg_path.write_text(json.dumps(cfg, indent=2))
+            except OSError:
+                return False
+        return True
 
     # ------------------------------------------------------------------
     # Phase 3: Push Docker Image
@@ -519,9 +794,10 @@ class DeployFlow:
         if not ecr_uri:
             # Try loading from shared CloudFormation stack
             try:
-                shared_outputs = _get_cf_outputs(SHARED_STACK_NAME, self.region)
+                shared_outputs = self._outputs(SHARED_STACK_NAME)
                 ecr_uri = shared_outputs.get("EcrRepoUri", "")
                 self.state["ecr_repo_uri"] = ecr_uri
+                self._mark_state_dirty()
             except Exception:
                 pass
         if not ecr_uri:
@@ -530,30 +806,59 @@ class DeployFlow:
 
         registry = ecr_uri.split("/")[0]
 
-        # ECR auth
-        import boto3
-
-        ecr = boto3.client("ecr", region_name=self.region)
-        token_resp = ecr.get_authorization_token()
-        auth = token_resp["authorizationData"][0]
-        token = base64.b64decode(auth["authorizationToken"]).decode()
-        username, password = token.split(":", 1)
-
-        console.print("Logging into ECR...")
-        _run(
-            ["docker", "login", "--username", username, "--password-stdin", registry],
-            input=password.encode(),
-            check=True,
-        )
-
-        console.print("Building image (linux/amd64)...")
-        _run(
-            ["docker", "build", "--platform", "linux/amd64", "-t", f"{ecr_uri}:latest", "."],
-            cwd=self.project_root,
-        )
-
-        console.print("Pushing image...")
-        _run(["docker", "push", f"{ecr_uri}:latest"])
+        # ECR auth: prefer the docker credential helper, which lets docker
+        # fetch tokens itself — no login subprocess and no credential piped
+        # through a child's stdin.
+        if self._ensure_ecr_cred_helper(registry):
+            console.print("[dim]Using docker-credential-ecr-login for registry auth.[/dim]")
+        else:
+            token_resp = self.ecr.get_authorization_token()
+            auth = token_resp["authorizationData"][0]
+            # Split the decoded token as bytes: the password half goes
+            # straight to docker's stdin, so decoding it to str only to
+            # re-encode it would copy the secret twice for nothing.
+            token = base64.b64decode(auth["authorizationToken"])
+            sep = token.index(b":")
+            username = token[:sep].decode("ascii")
+            password = token[sep + 1:]
+
+            console.print("Logging into ECR...")
+            _run(
+                ["docker", "login", "--username", username, "--password-stdin", registry],
+                input=password,
+                check=True,
+            )
+
+        # buildx with a registry-hosted layer cache: unchanged layers are
+        # skipped on rebuild, and --push fuses build+push so pushed layers
+        # aren't re-hashed by a separate docker push.
+        console.print("Building and pushing image (linux/amd64)...")
+        build_cmd = [
+            "docker", "buildx", "build",
+            "--platform", "linux/amd64",
+            "-t", f"{ecr_uri}:latest",
+            "--push",
+        ]
+        # ECR only accepts cache manifests as OCI image manifests; without
+        # image-manifest/oci-mediatypes it rejects the cache export and
+        # buildx exits non-zero after an otherwise successful build.
+        cache_flags = [
+            "--cache-from", f"type=registry,ref={ecr_uri}:buildcache",
+            "--cache-to", (
+                f"type=registry,ref={ecr_uri}:buildcache,"
+                "mode=max,image-manifest=true,oci-mediatypes=true"
+            ),
+        ]
+        # os.environ spread first so the flag wins over a pre-existing
+        # DOCKER_BUILDKIT=0 in the caller's environment.
+        env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+        result = _run([*build_cmd, *cache_flags, "."], cwd=self.project_root, env=env, check=False)
+        if result.returncode != 0:
+            # The cache is an optimization, not a requirement — if the
+            # registry still refuses the export, retry once without it
+            # rather than failing the deploy.
+            console.print("[yellow]Build with registry cache failed — retrying without cache export.[/yellow]")
+            _run([*build_cmd, "."], cwd=self.project_root, env=env)
 
         console.print("[green]Image pushed.[/green]\n")
 
@@ -561,62 +866,73 @@ class DeployFlow:
     # Phase 4: Upload Secrets (org + instance)
     # ------------------------------------------------------------------
 
+    def _resolve_secret_arn(self, state_key: str, stack_name: str, output_key: str, secret_id: str) -> str:
+        """Resolve a secret ARN from state, stack outputs, or a direct lookup."""
+        arn = self.state.get(state_key, "")
+        if not arn:
+            try:
+                arn = self._outputs(stack_name).get(output_key, "")
+            except Exception:
+                pass
+        if not arn:
+            try:
+                arn = self.sm.describe_secret(SecretId=secret_id)["ARN"]
+            except Exception:
+                pass
+        return arn
+
     def _phase4_upload_secrets(self) -> None:
         console.rule("[bold]Phase 4: Upload Secrets")
 
-        import boto3
-        sm = boto3.client("secretsmanager", region_name=self.region)
+        # Resolve ARNs first, then issue the PutSecretValue calls in
+        # parallel — boto3 clients are thread-safe and the two uploads are
+        # independent, so the phase takes max(org, instance) not the sum.
+        uploads: list[tuple[str, str, dict, str]] = []
 
-        # Upload org secrets (if collected)
         if self.org_secrets:
-            org_arn = self.state.get("org_secret_arn")
-            if not org_arn:
-                try:
-                    shared_outputs = _get_cf_outputs(SHARED_STACK_NAME, self.region)
-                    org_arn = shared_outputs.get("OrgSecretArn", "")
-                except Exception:
-                    pass
-            if not org_arn:
-                # Try direct lookup
-                try:
-                    resp = sm.describe_secret(SecretId="nanobot/org")
-                    org_arn = resp["ARN"]
-                except Exception:
-                    pass
-
-            if org_arn:
-                sm.put_secret_value(
-                    SecretId=org_arn,
-                    SecretString=json.dumps(self.org_secrets),
-                )
-                console.print("[green]Org secrets uploaded to nanobot/org.[/green]")
+            if self._remote_secret_hashes.get("nanobot/org") == _secret_hash(self.org_secrets):
+                # Identical to what Secrets Manager holds — a re-upload
+                # would only burn a KMS write.
+                console.print("[dim]Org secrets unchanged — skipping upload.[/dim]")
             else:
-                console.print("[yellow]Org secret ARN not found — skipping org upload.[/yellow]")
+                org_arn = self._resolve_secret_arn(
+                    "org_secret_arn", SHARED_STACK_NAME, "OrgSecretArn", "nanobot/org"
+                )
+                if org_arn:
+                    uploads.append(("Org", "nanobot/org", self.org_secrets, org_arn))
+                else:
+                    console.print("[yellow]Org secret ARN not found — skipping org upload.[/yellow]")
 
-        # Upload instance secrets
         if self.instance_secrets:
-            instance_arn = self.state.get("instance_secret_arn")
-            if not instance_arn:
-                try:
-                    instance_outputs = _get_cf_outputs(self.instance_stack_name, self.region)
-                    instance_arn = instance_outputs.get("InstanceSecretArn", "")
-                except Exception:
-                    pass
-            if not instance_arn:
-                try:
-                    resp = sm.describe_secret(SecretId=f"nanobot/instance/{self.instance}")
-                    instance_arn = resp["ARN"]
-                except Exception:
-                    pass
-
-            if instance_arn:
-                sm.put_secret_value(
-                    SecretId=instance_arn,
-                    SecretString=json.dumps(self.instance_secrets),
-                )
-                console.print(f"[green]Instance secrets uploaded to nanobot/instance/{self.instance}.[/green]")
+            instance_id = f"nanobot/instance/{self.instance}"
+            if self._remote_secret_hashes.get(instance_id) == _secret_hash(self.instance_secrets):
+                console.print("[dim]Instance secrets unchanged — skipping upload.[/dim]")
             else:
-                console.print("[yellow]Instance secret ARN not found — skipping instance upload.[/yellow]")
+                instance_arn = self._resolve_secret_arn(
+                    "instance_secret_arn", self.instance_stack_name, "InstanceSecretArn", instance_id
+                )
+                if instance_arn:
+                    uploads.append(("Instance", instance_id, self.instance_secrets, instance_arn))
+                else:
+                    console.print("[yellow]Instance secret ARN not found — skipping instance upload.[/yellow]")
+
+        if uploads:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=len(uploads)) as ex:
+                futures = [
+                    ex.submit(
+                        self.sm.put_secret_value,
+                        SecretId=arn,
+                        SecretString=orjson.dumps(payload).decode(),
+                    )
+                    for _, _, payload, arn in uploads
+                ]
+                for fut in futures:
+                    fut.result()
+            for label, secret_id, _, _ in uploads:
+                self._invalidate_secret(secret_id)
+                console.print(f"[green]{label} secrets uploaded to {secret_id}.[/green]")
 
         if not self.org_secrets and not self.instance_secrets:
             console.print("[yellow]No secrets collected — skipping.[/yellow]")
@@ -628,13 +944,15 @@ class DeployFlow:
     # ------------------------------------------------------------------
 
     def _phase5_start_container(self) -> None:
+        asyncio.run(self._phase5_start_container_async())
+
+    async def _phase5_start_container_async(self) -> None:
         console.rule("[bold]Phase 5: Start Container")
 
         ip = self.state.get("public_ip")
         if not ip:
             try:
-                instance_outputs = _get_cf_outputs(self.instance_stack_name, self.region)
-                self._save_instance_outputs(instance_outputs)
+                self._save_instance_outputs(self._outputs(self.instance_stack_name))
                 ip = self.state.get("public_ip")
             except Exception:
                 pass
@@ -642,50 +960,123 @@ class DeployFlow:
             console.print("[red]Public IP not found. Run CDK deploy first.[/red]")
             raise SystemExit(1)
 
-        ssh_base = ["ssh", "-o", "StrictHostKeyChecking=no", "-o", "ConnectTimeout=10", f"ubuntu@{ip}"]
+        ssh_base = [
+            "ssh", "-o", "StrictHostKeyChecking=no", "-o", "ConnectTimeout=10",
+            *_SSH_MUX_OPTS, f"ubuntu@{ip}",
+        ]
 
-        # Wait for bootstrap (up to 5 min)
+        # Wait for bootstrap (up to 5 min): stream the setup log over the
+        # multiplexed connection and wake on the marker line, instead of
+        # re-running grep over a fresh handshake every 10s.
         console.print("Waiting for instance bootstrap...")
-        for attempt in range(30):
-            try:
-                result = _run(
-                    [*ssh_base, "grep -q 'Bootstrap complete' /var/log/nanobot-setup.log"],
-                    capture=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    console.print("[green]Bootstrap complete.[/green]")
-                    break
-            except Exception:
-                pass
-            if attempt < 29:
-                time.sleep(10)
+        if await self._wait_bootstrap(ssh_base, timeout=300):
+            console.print("[green]Bootstrap complete.[/green]")
         else:
             console.print("[yellow]Bootstrap not confirmed after 5 min — proceeding anyway.[/yellow]")
 
         # Restart nanobot service
         console.print("Restarting nanobot service...")
-        _run([*ssh_base, "sudo systemctl restart nanobot"], check=False)
+        await _run_async([*ssh_base, "sudo systemctl restart nanobot"], check=False)
 
-        # Wait for health
+        # Wait for health: subscribe to the daemon's health_status events
+        # and wake on the transition, instead of re-running docker inspect
+        # over SSH every 2s.
         console.print("Waiting for container health...")
-        for attempt in range(15):
+        if await self._wait_healthy(ssh_base, timeout=30):
+            console.print("[green]Container is healthy![/green]\n")
+            return
+
+        console.print(f"[yellow]Container not healthy after 30s. Check logs with: ssh ubuntu@{ip} sudo journalctl -u nanobot[/yellow]\n")
+
+    async def _wait_healthy(self, ssh_base: list[str], *, timeout: float) -> bool:
+        """Await the container's healthy transition via the docker events stream.
+
+        Re-subscribes when the stream EOFs before the transition (dropped
+        connection), until the deadline actually elapses.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while deadline - loop.time() > 0:
+            proc = None
             try:
-                result = _run(
+                proc = await asyncio.create_subprocess_exec(
+                    *ssh_base,
+                    "sudo docker events --filter container=nanobot-gateway "
+                    "--filter event=health_status --format '{{.Status}}'",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+
+                # The stream only carries future transitions; the container may
+                # already be healthy by the time we subscribe, so check once.
+                result = await _run_async(
                     [*ssh_base, "sudo docker inspect --format='{{.State.Health.Status}}' nanobot-gateway"],
                     capture=True,
                     check=False,
                 )
-                status = result.stdout.strip() if result.stdout else ""
-                if status == "healthy":
-                    console.print("[green]Container is healthy![/green]\n")
-                    return
-                console.print(f"  [dim]Health: {status or 'waiting'}[/dim]")
-            except Exception:
+                if result.stdout and result.stdout.strip().strip("'") == "healthy":
+                    return True
+
+                async def _scan() -> bool:
+                    while True:
+                        line = await proc.stdout.readline()
+                        if not line:
+                            return False  # connection dropped before the transition
+                        if line.strip().strip(b"'").endswith(b": healthy"):
+                            return True
+
+                if await asyncio.wait_for(_scan(), timeout=deadline - loop.time()):
+                    return True
+            except asyncio.TimeoutError:
+                return False
+            except OSError:
                 pass
-            time.sleep(2)
+            finally:
+                if proc is not None and proc.returncode is None:
+                    proc.kill()
+            # EOF before the transition — pause briefly and re-subscribe.
+            await asyncio.sleep(2)
+        return False
+
+    async def _wait_bootstrap(self, ssh_base: list[str], *, timeout: float) -> bool:
+        """Await the 'Bootstrap complete' marker by tailing the setup log remotely.
+
+        On a first deploy sshd often isn't accepting connections yet, so a
+        single tail attempt would EOF within seconds; re-spawn the tail
+        after a short pause until the deadline actually elapses.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while deadline - loop.time() > 0:
+            proc = None
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *ssh_base,
+                    "tail -n +1 -F /var/log/nanobot-setup.log 2>/dev/null",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
 
-        console.print(f"[yellow]Container not healthy after 30s. Check logs with: ssh ubuntu@{ip} sudo journalctl -u nanobot[/yellow]\n")
+                async def _scan() -> bool:
+                    while True:
+                        line = await proc.stdout.readline()
+                        if not line:
+                            return False  # connection dropped before the marker
+                        if b"Bootstrap complete" in line:
+                            return True
+
+                if await asyncio.wait_for(_scan(), timeout=deadline - loop.time()):
+                    return True
+            except asyncio.TimeoutError:
+                return False
+            except OSError:
+                pass
+            finally:
+                if proc is not None and proc.returncode is None:
+                    proc.kill()
+            # EOF before the marker — ssh refused or dropped; retry the tail.
+            await asyncio.sleep(5)
+        return False
 
     # ------------------------------------------------------------------
     # Phase 6: Upload Workspace
@@ -708,7 +1099,7 @@ class DeployFlow:
         agent_instance = os.environ.get("AGENT_INSTANCE", self.instance)
 
         remote_dir = "/data/.nanobot/workspace"
-        ssh_base = ["ssh", "-o", "StrictHostKeyChecking=no", f"ubuntu@{ip}"]
+        ssh_base = ["ssh", "-o", "StrictHostKeyChecking=no", *_SSH_MUX_OPTS, f"ubuntu@{ip}"]
 
         # Ensure remote dir exists
         _run([*ssh_base, f"sudo mkdir -p {remote_dir}"], check=False)
@@ -731,6 +1122,9 @@ class DeployFlow:
         """Upload workspace files via scp (fallback when S3 is not configured)."""
         templates_dir = Path(__file__).resolve().parent.parent / "templates"
 
+        # Interactive editing happens up front; the uploads themselves are
+        # independent and go out in parallel over the multiplexed session.
+        uploads: list[tuple[str, Path]] = []
         for filename in ("SOUL.md", "USER.md", "AGENTS.md"):
             local = templates_dir / filename
             if not local.exists():
@@ -742,10 +1136,25 @@ class DeployFlow:
             if editor and Confirm.ask(f"  Edit {filename} in $EDITOR before upload?", default=False):
                 subprocess.run([editor, str(local)])
 
-            _run(["scp", "-o", "StrictHostKeyChecking=no", str(local), f"ubuntu@{ip}:/tmp/{filename}"])
-            _run([*ssh_base, f"sudo mv /tmp/{filename} {remote_dir}/{filename} && sudo chown root:root {remote_dir}/{filename}"])
+            uploads.append((filename, local))
+
+        if not uploads:
+            return
+
+        async def _upload(filename: str, local: Path) -> None:
+            await _run_async(
+                ["scp", "-o", "StrictHostKeyChecking=no", *_SSH_MUX_OPTS, str(local), f"ubuntu@{ip}:/tmp/{filename}"]
+            )
+            await _run_async(
+                [*ssh_base, f"sudo mv /tmp/{filename} {remote_dir}/{filename} && sudo chown root:root {remote_dir}/{filename}"]
+            )
             console.print(f"  [green]Uploaded {filename}[/green]")
 
+        async def _upload_all() -> None:
+            await asyncio.gather(*(_upload(f, p) for f, p in uploads))
+
+        asyncio.run(_upload_all())
+
     # ------------------------------------------------------------------
     # Phase 7: Print GitHub Secrets
     # ------------------------------------------------------------------
@@ -766,22 +1175,46 @@ class DeployFlow:
         )
 
         # Auto-set via gh CLI if available
-        if shutil.which("gh"):
+        if _which("gh"):
             if Confirm.ask("Set secrets automatically via `gh secret set`?", default=False):
                 secrets_to_set = {
                     "AWS_REGION": self.region,
                     "LIGHTSAIL_HOST": ip,
                 }
-                for name, value in secrets_to_set.items():
-                    result = _run(
-                        ["gh", "secret", "set", name, "--body", value],
-                        check=False,
-                        capture=True,
-                    )
-                    if result.returncode == 0:
+                # One gh invocation reading K=V lines from stdin sets every
+                # secret in a single subprocess + API call instead of one
+                # gh startup per secret.
+                env_blob = "".join(f"{k}={v}\n" for k, v in secrets_to_set.items())
+                result = _run(
+                    ["gh", "secret", "set", "--env-file", "-"],
+                    check=False,
+                    input=env_blob.encode(),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                if result.returncode == 0:
+                    for name in secrets_to_set:
                         console.print(f"  [green]Set {name}[/green]")
-                    else:
-                        console.print(f"  [red]Failed to set {name}[/red]")
+                else:
+                    # Older gh without --env-file stdin support: fall back
+                    # to per-secret calls, overlapped in a thread pool.
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    def _set_one(item: tuple[str, str]) -> tuple[str, bool]:
+                        name, value = item
+                        res = _run(
+                            ["gh", "secret", "set", name, "--body", value],
+                            check=False,
+                            capture=True,
+                        )
+                        return name, res.returncode == 0
+
+                    with ThreadPoolExecutor(max_workers=len(secrets_to_set)) as pool:
+                        for name, ok in pool.map(_set_one, secrets_to_set.items()):
+                            if ok:
+                                console.print(f"  [green]Set {name}[/green]")
+                            else:
+                                console.print(f"  [red]Failed to set {name}[/red]")
 
                 console.print(
                     "\n[yellow]Note:[/yellow] You still need to manually set "
@@ -9,13 +9,16 @@ Commands:
 from __future__ import annotations
 
 import json
+import re
 import secrets
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
 
+import orjson
 import typer
-from rich.console import Console
-from rich.table import Table
 
 invite_app = typer.Typer(
     name="invite",
@@ -23,21 +26,59 @@ invite_app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
-
 INVITE_PREFIX = "nanobot/invites/"
 
+# Account identity, org secret ARN, ECR URI and agent bucket barely ever
+# change; caching them on disk for an hour lets repeat invite commands
+# skip three to four API round-trips.
+_CACHE_DIR = Path.home() / ".nanobot" / "cache"
+_CONTEXT_TTL = 3600
+
+
+def _load_aws_context(region: str) -> dict | None:
+    f = _CACHE_DIR / f"aws-context-{region}.json"
+    try:
+        data = json.loads(f.read_text())
+    except Exception:
+        return None
+    if data.get("expires_at", 0) < time.time():
+        return None
+    return data
+
+
+def _save_aws_context(region: str, ctx: dict) -> None:
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        ctx["expires_at"] = time.time() + _CONTEXT_TTL
+        (_CACHE_DIR / f"aws-context-{region}.json").write_text(json.dumps(ctx))
+    except OSError:
+        pass
+
+
+def _drop_aws_context(region: str) -> None:
+    (_CACHE_DIR / f"aws-context-{region}.json").unlink(missing_ok=True)
 
+
+@lru_cache(maxsize=1)
+def _console():
+    """Console built on first use: rich import + TTY probing stay off the
+    import path of unrelated CLI subcommands."""
+    from rich.console import Console
+
+    return Console()
+
+
+_DUR_RE = re.compile(r"^(\d+)([hdm])$")
+_DUR_UNITS = {"h": "hours", "d": "days", "m": "minutes"}
+
+
+@lru_cache(maxsize=32)
 def _parse_duration(s: str) -> timedelta:
     """Parse a human duration like '24h', '7d', '30m' into a timedelta."""
-    s = s.strip().lower()
-    if s.endswith("h"):
-        return timedelta(hours=int(s[:-1]))
-    if s.endswith("d"):
-        return timedelta(days=int(s[:-1]))
-    if s.endswith("m"):
-        return timedelta(minutes=int(s[:-1]))
-    raise typer.BadParameter(f"Invalid duration: {s}. Use e.g. '24h', '7d', '30m'.")
+    m = _DUR_RE.match(s.strip().lower())
+    if not m:
+        raise typer.BadParameter(f"Invalid duration: {s}. Use e.g. '24h', '7d', '30m'.")
+    return timedelta(**{_DUR_UNITS[m.group(2)]: int(m.group(1))})
 
 
 @invite_app.command()
@@ -50,40 +91,54 @@ def create(
     import boto3
 
     sm = boto3.client("secretsmanager", region_name=region)
-    sts = boto3.client("sts", region_name=region)
 
-    account_id = sts.get_caller_identity()["Account"]
     duration = _parse_duration(expires)
     expires_at = datetime.now(timezone.utc) + duration
 
     invite_id = str(uuid.uuid4())[:8]
     token = secrets.token_urlsafe(33)  # 44-char base64url
 
-    # Resolve org secret ARN
-    try:
-        org_resp = sm.describe_secret(SecretId="nanobot/org")
-        org_secret_arn = org_resp["ARN"]
-    except Exception:
-        console.print("[red]Org secret 'nanobot/org' not found. Deploy shared stack first.[/red]")
-        raise typer.Exit(1)
-
-    # Resolve ECR repo URI
-    ecr = boto3.client("ecr", region_name=region)
-    try:
-        ecr_resp = ecr.describe_repositories(repositoryNames=["nanobot"])
-        ecr_repo_uri = ecr_resp["repositories"][0]["repositoryUri"]
-    except Exception:
-        ecr_repo_uri = f"{account_id}.dkr.ecr.{region}.amazonaws.com/nanobot"
-
-    # Resolve agent bucket from context (check CloudFormation)
-    agent_bucket = ""
-    try:
-        cf = boto3.client("cloudformation", region_name=region)
-        resp = cf.describe_stacks(StackName="NanobotSharedStack")
-        outputs = {o["OutputKey"]: o["OutputValue"] for o in resp["Stacks"][0].get("Outputs", [])}
-        agent_bucket = outputs.get("AgentBucketName", "")
-    except Exception:
-        pass
+    ctx = _load_aws_context(region)
+    if ctx is None:
+        sts = boto3.client("sts", region_name=region)
+        account_id = sts.get_caller_identity()["Account"]
+
+        # Resolve org secret ARN
+        try:
+            org_resp = sm.describe_secret(SecretId="nanobot/org")
+            org_secret_arn = org_resp["ARN"]
+        except Exception:
+            _console().print("[red]Org secret 'nanobot/org' not found. Deploy shared stack first.[/red]")
+            raise typer.Exit(1)
+
+        # Resolve ECR repo URI
+        ecr = boto3.client("ecr", region_name=region)
+        try:
+            ecr_resp = ecr.describe_repositories(repositoryNames=["nanobot"])
+            ecr_repo_uri = ecr_resp["repositories"][0]["repositoryUri"]
+        except Exception:
+            ecr_repo_uri = f"{account_id}.dkr.ecr.{region}.amazonaws.com/nanobot"
+
+        # Resolve agent bucket from context (check CloudFormation)
+        agent_bucket = ""
+        try:
+            cf = boto3.client("cloudformation", region_name=region)
+            resp = cf.describe_stacks(StackName="NanobotSharedStack")
+            outputs = {o["OutputKey"]: o["OutputValue"] for o in resp["Stacks"][0].get("Outputs", [])}
+            agent_bucket = outputs.get("AgentBucketName", "")
+        except Exception:
+            pass
+
+        _save_aws_context(region, {
+            "account_id": account_id,
+            "org_secret_arn": org_secret_arn,
+            "ecr_repo_uri": ecr_repo_uri,
+            "agent_bucket": agent_bucket,
+        })
+    else:
+        org_secret_arn = ctx["org_secret_arn"]
+        ecr_repo_uri = ctx["ecr_repo_uri"]
+        agent_bucket = ctx["agent_bucket"]
 
     invite_data = {
         "token": token,
@@ -98,18 +153,28 @@ def create(
     }
 
     secret_name = f"{INVITE_PREFIX}{invite_id}"
-    sm.create_secret(
-        Name=secret_name,
-        Description=f"Nanobot invite for instance '{instance}' (expires {expires_at.isoformat()})",
-        SecretString=json.dumps(invite_data),
-    )
-
-    console.print(f"\n[green]Invite created![/green]")
-    console.print(f"  ID:       [cyan]{invite_id}[/cyan]")
-    console.print(f"  Instance: [cyan]{instance}[/cyan]")
-    console.print(f"  Expires:  [cyan]{expires_at.strftime('%Y-%m-%d %H:%M UTC')}[/cyan]")
-    console.print(f"\n[bold]Send this to your team member:[/bold]\n")
-    console.print(
+    try:
+        sm.create_secret(
+            Name=secret_name,
+            Description=f"Nanobot invite for instance '{instance}' (expires {expires_at.isoformat()})",
+            SecretString=orjson.dumps(invite_data).decode(),
+            Tags=[
+                {"Key": "nanobot:kind", "Value": "invite"},
+                {"Key": "nanobot:instance", "Value": instance},
+            ],
+        )
+    except Exception:
+        # The cached context may be stale (rotated ARNs, torn-down stack);
+        # drop it so the next attempt re-resolves from the APIs.
+        _drop_aws_context(region)
+        raise
+
+    _console().print(f"\n[green]Invite created![/green]")
+    _console().print(f"  ID:       [cyan]{invite_id}[/cyan]")
+    _console().print(f"  Instance: [cyan]{instance}[/cyan]")
+    _console().print(f"  Expires:  [cyan]{expires_at.strftime('%Y-%m-%d %H:%M UTC')}[/cyan]")
+    _console().print(f"\n[bold]Send this to your team member:[/bold]\n")
+    _console().print(
         f'  curl -sL https://raw.githubusercontent.com/YOUR_ORG/nanobot/main/scripts/join.sh | \\\n'
         f'    INVITE_TOKEN={token} INVITE_ID={invite_id} bash\n'
     )
@@ -121,62 +186,125 @@ def list_invites(
 ) -> None:
     """List all invites with their status."""
     import boto3
+    from botocore.config import Config
 
-    sm = boto3.client("secretsmanager", region_name=region)
+    # A wider connection pool than the default 10, so the parallel
+    # fallback reads below aren't serialized by the pool itself.
+    sm = boto3.client(
+        "secretsmanager", region_name=region, config=Config(max_pool_connections=32)
+    )
 
     # List all secrets with the invite prefix
     paginator = sm.get_paginator("list_secrets")
-    invites: list[dict] = []
-
+    secret_names: list[str] = []
+    # Filter server-side by the tag stamped at creation, which is more
+    # selective than a name scan on accounts with many secrets; the name
+    # prefix stays as a secondary guard (filters are ANDed).
     for page in paginator.paginate(
-        Filters=[{"Key": "name", "Values": [INVITE_PREFIX]}],
+        Filters=[
+            {"Key": "tag-key", "Values": ["nanobot:kind"]},
+            {"Key": "tag-value", "Values": ["invite"]},
+            {"Key": "name", "Values": [INVITE_PREFIX]},
+        ],
+        # 100 is the ListSecrets maximum; the default page size would cost
+        # one round-trip per handful of invites
+        PaginationConfig={"PageSize": 100},
     ):
-        for entry in page.get("SecretList", []):
-            secret_name = entry["Name"]
-            invite_id = secret_name.removeprefix(INVITE_PREFIX)
-            try:
-                resp = sm.get_secret_value(SecretId=secret_name)
-                data = json.loads(resp["SecretString"])
-                invites.append({"id": invite_id, **data})
-            except Exception:
-                invites.append({"id": invite_id, "error": True})
+        secret_names.extend(entry["Name"] for entry in page.get("SecretList", []))
+
+    # Fetch values in batches of 20 (the API maximum) instead of one
+    # round-trip per invite; only entries the batch reports as failed get
+    # an individual retry.
+    invites: list[dict] = []
+
+    def _parse(secret_name: str, secret_string: str) -> None:
+        invite_id = secret_name.removeprefix(INVITE_PREFIX)
+        try:
+            data = json.loads(secret_string)
+            invites.append({"id": invite_id, **data})
+        except Exception:
+            invites.append({"id": invite_id, "error": True})
+
+    failed: list[str] = []
+    for i in range(0, len(secret_names), 20):
+        chunk = secret_names[i:i + 20]
+        try:
+            resp = sm.batch_get_secret_value(SecretIdList=chunk)
+        except Exception:
+            # Older botocore without the batch API: per-secret reads
+            resp = {"Errors": [{"SecretId": name} for name in chunk]}
+        for sv in resp.get("SecretValues", []):
+            _parse(sv.get("Name", ""), sv.get("SecretString", ""))
+        failed.extend(err.get("SecretId", "") for err in resp.get("Errors", []))
+
+    if failed:
+        # Individual reads are pure round-trip wait; overlap them in a
+        # thread pool (boto3 clients are thread-safe for calls).
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=min(16, len(failed))) as pool:
+            futures = {
+                pool.submit(sm.get_secret_value, SecretId=name): name for name in failed
+            }
+            for fut in as_completed(futures):
+                secret_name = futures[fut]
+                try:
+                    _parse(secret_name, fut.result()["SecretString"])
+                except Exception:
+                    invites.append({"id": secret_name.removeprefix(INVITE_PREFIX), "error": True})
+
+    # as_completed scrambles arrival order; present invites stably
+    invites.sort(key=lambda inv: inv["id"])
 
     if not invites:
-        console.print("[dim]No invites found.[/dim]")
+        _console().print("[dim]No invites found.[/dim]")
         return
 
-    table = Table(title="Nanobot Invites")
+    from rich.table import Table
+    from rich.text import Text
+
+    # Pre-resolved Text styles (shared across rows, no markup re-parsing
+    # per cell) and a box-less, fixed-width table so Rich skips the second
+    # measure pass on long listings.
+    table = Table(title="Nanobot Invites", box=None, expand=False, show_lines=False, padding=(0, 1))
     table.add_column("ID", style="cyan")
     table.add_column("Instance")
     table.add_column("Status")
     table.add_column("Expires")
     table.add_column("Created")
 
-    now = datetime.now(timezone.utc)
+    status_error = Text("error reading", style="red")
+    status_used = Text("used", style="dim")
+    status_expired = Text("expired", style="yellow")
+    status_active = Text("active", style="green")
+
+    # Every timestamp here was written by this module via isoformat() in
+    # UTC, so the strings order the same way the datetimes would; slicing
+    # and comparing them beats a fromisoformat parse per row.
+    now_iso = datetime.now(timezone.utc).isoformat()
     for inv in invites:
         if inv.get("error"):
-            table.add_row(inv["id"], "?", "[red]error reading[/red]", "", "")
+            table.add_row(inv["id"], "?", status_error, "", "")
             continue
 
-        expires_at = datetime.fromisoformat(inv.get("expiresAt", "2000-01-01T00:00:00+00:00"))
-        used = inv.get("used", False)
+        expires_iso = inv.get("expiresAt", "2000-01-01T00:00:00+00:00")
 
-        if used:
-            status = "[dim]used[/dim]"
-        elif expires_at < now:
-            status = "[yellow]expired[/yellow]"
+        if inv.get("used", False):
+            status = status_used
+        elif expires_iso < now_iso:
+            status = status_expired
         else:
-            status = "[green]active[/green]"
+            status = status_active
 
         table.add_row(
             inv["id"],
             inv.get("instanceName", "?"),
             status,
-            expires_at.strftime("%Y-%m-%d %H:%M"),
+            f"{expires_iso[:10]} {expires_iso[11:16]}",
             inv.get("createdAt", "?")[:16],
         )
 
-    console.print(table)
+    _console().print(table)
 
 
 @invite_app.command()
@@ -192,7 +320,7 @@ def revoke(
 
     try:
         sm.delete_secret(SecretId=secret_name, ForceDeleteWithoutRecovery=True)
-        console.print(f"[green]Invite {invite_id} revoked.[/green]")
+        _console().print(f"[green]Invite {invite_id} revoked.[/green]")
     except sm.exceptions.ResourceNotFoundException:
-        console.print(f"[red]Invite {invite_id} not found.[/red]")
+        _console().print(f"[red]Invite {invite_id} not found.[/red]")
         raise typer.Exit(1)
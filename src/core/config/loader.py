@@ -233,6 +233,23 @@ def get_data_dir() -> Path:
     return get_data_path()
 
 
+# Parsed configs keyed by (path, mtime_ns, env fingerprint): repeat calls
+# from cron ticks and request handling skip the file read, JSON parse and
+# pydantic validation entirely. A changed file or relevant env var changes
+# the key, so invalidation is automatic.
+_CONFIG_CACHE: dict[tuple, Config] = {}
+_CONFIG_CACHE_MAX = 4
+
+
+def _env_fingerprint() -> int:
+    """Hash of every env var that can influence the loaded config."""
+    relevant = sorted(
+        (k, v) for k, v in os.environ.items()
+        if k in _ENV_MAP or k.startswith("NANOBOT_")
+    )
+    return hash(tuple(relevant))
+
+
 def load_config(config_path: Path | None = None) -> Config:
     """
     Load configuration from file or create default.
@@ -240,6 +257,9 @@ def load_config(config_path: Path | None = None) -> Config:
     Loads .env first, then config.json. Environment variables fill in any
     values not already set in config.json (config.json always wins).
 
+    Results are cached against the file's mtime and the relevant env vars;
+    call ``load_config.cache_clear()`` to force a re-read.
+
     Args:
         config_path: Optional path to config file. Uses default if not provided.
 
@@ -250,6 +270,16 @@ def load_config(config_path: Path | None = None) -> Config:
     _load_dotenv()
 
     path = config_path or get_config_path()
+
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    cache_key = (str(path), mtime_ns, _env_fingerprint())
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     data: dict = {}
 
     if path.exists():
@@ -264,7 +294,15 @@ def load_config(config_path: Path | None = None) -> Config:
     # Step 2: conditionally merge env vars into config data
     data = _inject_env_into_config(data)
 
-    return Config.model_validate(data) if data else Config()
+    config = Config.model_validate(data) if data else Config()
+    if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+        # Oldest-inserted eviction is enough here; dicts keep insertion order
+        del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+    _CONFIG_CACHE[cache_key] = config
+    return config
+
+
+load_config.cache_clear = _CONFIG_CACHE.clear  # lru_cache-style escape hatch
 
 
 def save_config(config: Config, config_path: Path | None = None) -> None:
@@ -1,7 +1,20 @@
 """LLM provider abstraction module."""
 
 from core.providers.base import LLMProvider, LLMResponse
-from core.providers.litellm import LiteLLMProvider
-from core.providers.openai_codex import OpenAICodexProvider
 
 __all__ = ["LLMProvider", "LLMResponse", "LiteLLMProvider", "OpenAICodexProvider"]
+
+
+def __getattr__(name: str):
+    # PEP 562 lazy re-exports: litellm drags in a heavy transitive import
+    # tree, so defer loading the concrete providers until one is actually
+    # requested. CLI subcommands that never talk to an LLM skip the cost.
+    if name == "LiteLLMProvider":
+        from core.providers.litellm import LiteLLMProvider
+
+        return LiteLLMProvider
+    if name == "OpenAICodexProvider":
+        from core.providers.openai_codex import OpenAICodexProvider
+
+        return OpenAICodexProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
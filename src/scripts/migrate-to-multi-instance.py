@@ -14,22 +14,79 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import sys
 from copy import deepcopy
 
+# orjson serializes several times faster than stdlib json; this script is
+# standalone, so fall back gracefully where only boto3 is installed.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
 
 def deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge override into base. Override wins on conflicts."""
-    result = dict(base)
-    for k, v in override.items():
-        if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-            result[k] = deep_merge(result[k], v)
-        else:
-            result[k] = v
+    """Merge override into base iteratively. Override wins on conflicts.
+
+    One deepcopy up front plus an explicit work stack replaces the
+    per-level dict copies and call frames of the recursive version.
+    """
+    if not override:
+        return base
+    result = deepcopy(base)
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, dict) and isinstance(dst.get(k), dict):
+                stack.append((dst[k], v))
+            else:
+                dst[k] = v
     return result
 
 
+def _emit(obj, write) -> None:
+    """Write a canonical byte serialization of obj through write.
+
+    Dict keys are visited in sorted order, so two structurally equal
+    configs always produce identical byte streams regardless of key
+    insertion order.
+    """
+    if isinstance(obj, dict):
+        write(b"{")
+        for k in sorted(obj):
+            write(json.dumps(k).encode())
+            write(b":")
+            _emit(obj[k], write)
+            write(b",")
+        write(b"}")
+    elif isinstance(obj, list):
+        write(b"[")
+        for v in obj:
+            _emit(v, write)
+            write(b",")
+        write(b"]")
+    else:
+        write(json.dumps(obj, separators=(",", ":")).encode())
+
+
+def canonical_hash(obj) -> bytes:
+    """Digest of the canonical serialization, streamed straight into sha256.
+
+    Comparing digests avoids materializing the full sorted JSON string
+    (hundreds of KB for wide configs) on both sides of an equality test.
+    """
+    h = hashlib.sha256()
+    _emit(obj, h.update)
+    return h.digest()
+
+
 # Keys that belong to the instance (everything else goes to org)
 INSTANCE_KEYS = {"channels"}
 # These are split: some fields go to org, some to instance
@@ -37,13 +94,18 @@ SPLIT_KEYS = {"gateway"}
 
 
 def split_config(config: dict) -> tuple[dict, dict]:
-    """Split a monolithic config into (org, instance) dicts."""
+    """Split a monolithic config into (org, instance) dicts.
+
+    Values are shared with config, not copied: the input is freshly
+    json.loads-ed data with no aliasing to preserve, and callers only
+    serialize the result. Don't mutate config after splitting.
+    """
     org = {}
     instance = {}
 
     for key, value in config.items():
         if key in INSTANCE_KEYS:
-            instance[key] = deepcopy(value)
+            instance[key] = value
         elif key == "gateway":
             # gateway.apiKey → instance, rest → org
             gw_org = {k: v for k, v in value.items() if k != "apiKey"}
@@ -55,7 +117,7 @@ def split_config(config: dict) -> tuple[dict, dict]:
             if gw_instance:
                 instance["gateway"] = gw_instance
         else:
-            org[key] = deepcopy(value)
+            org[key] = value
 
     return org, instance
 
@@ -86,6 +148,10 @@ def main() -> None:
 
     print(f"  Found {len(original)} top-level keys: {list(original.keys())}")
 
+    # Canonical digest of the original, computed once and reused by both
+    # verification passes.
+    orig_hash = canonical_hash(original)
+
     # ── 2. Split into org + instance ─────────────────────────────────────
     org, instance = split_config(original)
 
@@ -97,7 +163,7 @@ def main() -> None:
     if merged != original:
         print("\nWARNING: Deep-merge of split configs does not match original!")
         print("  Differences may be in key ordering. Checking values...")
-        if json.dumps(merged, sort_keys=True) == json.dumps(original, sort_keys=True):
+        if canonical_hash(merged) == orig_hash:
             print("  Values match (key ordering differs). Proceeding.")
         else:
             print("  Values DO NOT match. Aborting.")
@@ -118,31 +184,31 @@ def main() -> None:
         print(json.dumps(instance, indent=2))
         return
 
-    # Write org secret
+    # Write org secret. Attempt the update directly and fall back to
+    # create on ResourceNotFoundException — one round-trip on the common
+    # re-run path instead of a describe_secret precheck plus the write.
     print(f"\nWriting {org_name}...")
     try:
-        sm.describe_secret(SecretId=org_name)
-        sm.put_secret_value(SecretId=org_name, SecretString=json.dumps(org))
+        sm.put_secret_value(SecretId=org_name, SecretString=_dumps(org))
         print(f"  Updated existing {org_name}")
     except sm.exceptions.ResourceNotFoundException:
         sm.create_secret(
             Name=org_name,
             Description="Shared nanobot org config — LLM provider keys, integrations, tools.",
-            SecretString=json.dumps(org),
+            SecretString=_dumps(org),
         )
         print(f"  Created {org_name}")
 
     # Write instance secret
     print(f"Writing {instance_name}...")
     try:
-        sm.describe_secret(SecretId=instance_name)
-        sm.put_secret_value(SecretId=instance_name, SecretString=json.dumps(instance))
+        sm.put_secret_value(SecretId=instance_name, SecretString=_dumps(instance))
         print(f"  Updated existing {instance_name}")
     except sm.exceptions.ResourceNotFoundException:
         sm.create_secret(
             Name=instance_name,
             Description=f"Per-instance config for {args.instance} — channels, gateway key.",
-            SecretString=json.dumps(instance),
+            SecretString=_dumps(instance),
         )
         print(f"  Created {instance_name}")
 
@@ -152,7 +218,7 @@ def main() -> None:
     instance_read = json.loads(sm.get_secret_value(SecretId=instance_name)["SecretString"])
     re_merged = deep_merge(org_read, instance_read)
 
-    if json.dumps(re_merged, sort_keys=True) == json.dumps(original, sort_keys=True):
+    if re_merged == original or canonical_hash(re_merged) == orig_hash:
         print("  Verification passed: written secrets merge back to original.")
     else:
         print("  WARNING: Written secrets don't merge back to original!")
@@ -0,0 +1,103 @@
+"""Tests for the message bus — FIFO ordering, back-pressure, message lifecycle."""
+
+import asyncio
+import pickle
+
+import pytest
+
+from core.bus import events
+from core.bus.events import InboundMessage, OutboundMessage
+from core.bus.queue import MessageBus
+
+
+def _inbound(content: str, **kwargs) -> InboundMessage:
+    return InboundMessage(
+        channel="telegram", sender_id="u1", chat_id="c1", content=content, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_consume_fifo():
+    """Messages come out of consume_inbound in publish order."""
+    bus = MessageBus()
+    for i in range(5):
+        await bus.publish_inbound(_inbound(f"m{i}"))
+    got = [await bus.consume_inbound() for _ in range(5)]
+    assert [m.content for m in got] == [f"m{i}" for i in range(5)]
+    assert bus.inbound_size == 0
+
+
+@pytest.mark.asyncio
+async def test_drain_fifo():
+    """drain_inbound/drain_outbound return whole batches in publish order."""
+    bus = MessageBus()
+    for i in range(5):
+        await bus.publish_inbound(_inbound(f"m{i}"))
+        await bus.publish_outbound(
+            OutboundMessage(channel="telegram", chat_id="c1", content=f"r{i}")
+        )
+    assert [m.content for m in await bus.drain_inbound()] == [f"m{i}" for i in range(5)]
+    assert [m.content for m in await bus.drain_outbound()] == [f"r{i}" for i in range(5)]
+    assert bus.inbound_size == 0
+    assert bus.outbound_size == 0
+
+
+@pytest.mark.asyncio
+async def test_backpressure_blocks_and_unblocks():
+    """A publisher at maxsize waits until a consumer frees a slot."""
+    bus = MessageBus(maxsize=2)
+    await bus.publish_inbound(_inbound("a"))
+    await bus.publish_inbound(_inbound("b"))
+    assert bus.is_inbound_full
+
+    publish = asyncio.create_task(bus.publish_inbound(_inbound("c")))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert not publish.done()  # blocked at capacity
+
+    assert (await bus.consume_inbound()).content == "a"
+    await asyncio.wait_for(publish, timeout=1.0)
+    assert bus.inbound_size == 2
+
+
+def test_inbound_pickle_round_trip():
+    msg = _inbound("hi", media=("a.png",), metadata={"k": "v"})
+    clone = pickle.loads(pickle.dumps(msg))
+    assert clone == msg
+    assert clone.media == ("a.png",)
+    assert clone.metadata == {"k": "v"}
+    assert clone.session_key == msg.session_key
+
+
+def test_outbound_pickle_round_trip():
+    msg = OutboundMessage(
+        channel="discord", chat_id="c2", content="yo",
+        reply_to="m7", media=("b.png",), metadata={"x": 1},
+    )
+    clone = pickle.loads(pickle.dumps(msg))
+    assert clone == msg
+
+
+def test_session_key_override_folding():
+    """The override replaces the channel:chat_id key on both build paths."""
+    assert _inbound("hi").session_key == "telegram:c1"
+    assert _inbound("hi", session_key_override="thread:42").session_key == "thread:42"
+    made = InboundMessage.make("telegram", "u1", "c1", "hi", session_key_override="thread:42")
+    assert made.session_key == "thread:42"
+
+
+def test_released_instance_does_not_leak_payload():
+    """A recycled freelist instance carries nothing from its previous life."""
+    events._FREELIST.clear()
+    msg = InboundMessage.make(
+        "telegram", "u1", "c1", "secret", media=("a.png",), metadata={"k": "v"}
+    )
+    msg._release()
+    fresh = InboundMessage.make("slack", "u2", "c9", "new")
+    assert fresh is msg  # recycled, not freshly allocated
+    assert fresh.content == "new"
+    assert fresh.channel == "slack"
+    assert fresh.sender_id == "u2"
+    assert fresh.media == ()
+    assert not fresh.metadata
+    assert fresh.session_key == "slack:c9"
@@ -26,6 +26,13 @@ class TestGetConfigPath:
 class TestLoadConfig:
     """Tests for load_config()."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        """Isolate each test from the mtime/env-keyed config cache."""
+        load_config.cache_clear()
+        yield
+        load_config.cache_clear()
+
     def test_env_only_loading(self, tmp_path):
         """When no config file exists, NANOBOT_* env vars populate config."""
         missing = tmp_path / "does_not_exist.json"
@@ -68,3 +75,14 @@ class TestLoadConfig:
         cfg_file.write_text("NOT JSON!!!")
         config = load_config(config_path=cfg_file)
         assert config.gateway.port == 18790
+
+    def test_cache_hit_and_invalidation(self, tmp_path):
+        """Repeat loads reuse the parsed config until the file changes."""
+        cfg_file = tmp_path / "config.json"
+        cfg_file.write_text(json.dumps({"gateway": {"port": 1234}}))
+        first = load_config(config_path=cfg_file)
+        assert load_config(config_path=cfg_file) is first
+
+        cfg_file.write_text(json.dumps({"gateway": {"port": 4321}}))
+        os.utime(cfg_file, ns=(0, 0))  # force a distinct mtime
+        assert load_config(config_path=cfg_file).gateway.port == 4321